@@ -5,53 +5,74 @@ Demonstrates:
 - write() for cell values
 - meta_write() for formatting and structure changes (formatting, freeze,
   auto-resize, borders, etc.) — all in a single batched call
+- updateCells with a precomputed format grid in place of overlapping
+  repeatCell ops
 """
 
-import os
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from sheet_client import SheetsClient
+from _common import SPREADSHEET_ID, get_client
 
 
 def main():
-    # Replace with your spreadsheet ID
-    SPREADSHEET_ID = 'YOUR_SPREADSHEET_ID_HERE'
-
-    client = SheetsClient()
+    client = get_client()
 
     # Sheet ID is required for batchUpdate GridRange — pull it from metadata.
     meta = client.meta_read(SPREADSHEET_ID)
     sheet_id = meta['sheets'][0]['properties']['sheetId']
     print(f"Working with sheet ID: {sheet_id}")
 
+    header = ['Date', 'Product', 'Amount', 'Status']
+    rows = [
+        ['2024-01-15', 'Widget A', 1250.50, 'Completed'],
+        ['2024-01-16', 'Widget B',  890.00, 'Pending'],
+        ['2024-01-17', 'Widget A', 2100.75, 'Completed'],
+        ['2024-01-18', 'Widget C',  450.25, 'Cancelled'],
+    ]
+
     print("\n=== Writing Sales Data ===")
     client.write(SPREADSHEET_ID, [
-        {'range': 'Sheet1!A1',
-         'values': [['Date', 'Product', 'Amount', 'Status']]},
-        {'range': 'Sheet1!A2',
-         'values': [
-             ['2024-01-15', 'Widget A', 1250.50, 'Completed'],
-             ['2024-01-16', 'Widget B',  890.00, 'Pending'],
-             ['2024-01-17', 'Widget A', 2100.75, 'Completed'],
-             ['2024-01-18', 'Widget C',  450.25, 'Cancelled'],
-         ]},
+        {'range': 'Sheet1!A1', 'values': [header]},
+        {'range': 'Sheet1!A2', 'values': rows},
     ])
     print("Data written")
 
-    print("\n=== Applying Batch Formatting (8 ops, single call) ===")
+    # Every cell's format is worked out here and sent as one updateCells grid,
+    # rather than layering overlapping repeatCell ops that the server applies
+    # one after another.
+    header_fmt = {
+        'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9},
+        'textFormat': {'bold': True, 'fontSize': 11},
+        'horizontalAlignment': 'CENTER',
+    }
+    tint = {'red': 0.95, 'green': 0.97, 'blue': 1.0}
+    status_bg = {
+        'Completed': {'red': 0.85, 'green': 1.0, 'blue': 0.85},
+        'Cancelled': {'red': 1.0, 'green': 0.85, 'blue': 0.85},
+    }
+    currency = {'type': 'CURRENCY', 'pattern': '$#,##0.00'}
+
+    grid = [{'values': [{'userEnteredFormat': header_fmt}] * len(header)}]
+    for i, row in enumerate(rows):
+        cells = []
+        for col, value in enumerate(row):
+            fmt = {}
+            if i % 2:
+                fmt['backgroundColor'] = tint
+            if col == 2:
+                fmt['numberFormat'] = currency
+            if col == 3 and value in status_bg:
+                fmt['backgroundColor'] = status_bg[value]
+            cells.append({'userEnteredFormat': fmt})
+        grid.append({'values': cells})
+
+    print("\n=== Applying Batch Formatting (4 ops, single call) ===")
     client.meta_write(SPREADSHEET_ID, [
-        # 1. Header row: gray bg, bold, centered
-        {'repeatCell': {
-            'range': {'sheetId': sheet_id,
-                      'startRowIndex': 0, 'endRowIndex': 1,
-                      'startColumnIndex': 0, 'endColumnIndex': 4},
-            'cell': {'userEnteredFormat': {
-                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9},
-                'textFormat': {'bold': True, 'fontSize': 11},
-                'horizontalAlignment': 'CENTER',
-            }},
-            'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)',
+        # 1. Header style, alternating-row tint, currency column and status
+        #    colours — one grid write for the whole table
+        {'updateCells': {
+            'start': {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': 0},
+            'rows': grid,
+            'fields': 'userEnteredFormat(backgroundColor,textFormat,'
+                      'horizontalAlignment,numberFormat)',
         }},
 
         # 2. Freeze header row
@@ -67,51 +88,7 @@ def main():
                            'startIndex': 0, 'endIndex': 4},
         }},
 
-        # 4. Light blue alternating-row tint (data rows)
-        {'repeatCell': {
-            'range': {'sheetId': sheet_id,
-                      'startRowIndex': 2, 'endRowIndex': 5,
-                      'startColumnIndex': 0, 'endColumnIndex': 4},
-            'cell': {'userEnteredFormat': {
-                'backgroundColor': {'red': 0.95, 'green': 0.97, 'blue': 1.0},
-            }},
-            'fields': 'userEnteredFormat.backgroundColor',
-        }},
-
-        # 5. Currency format on Amount column
-        {'repeatCell': {
-            'range': {'sheetId': sheet_id,
-                      'startRowIndex': 1, 'endRowIndex': 5,
-                      'startColumnIndex': 2, 'endColumnIndex': 3},
-            'cell': {'userEnteredFormat': {
-                'numberFormat': {'type': 'CURRENCY', 'pattern': '$#,##0.00'},
-            }},
-            'fields': 'userEnteredFormat.numberFormat',
-        }},
-
-        # 6. Green for "Completed" (row index 1)
-        {'repeatCell': {
-            'range': {'sheetId': sheet_id,
-                      'startRowIndex': 1, 'endRowIndex': 2,
-                      'startColumnIndex': 3, 'endColumnIndex': 4},
-            'cell': {'userEnteredFormat': {
-                'backgroundColor': {'red': 0.85, 'green': 1.0, 'blue': 0.85},
-            }},
-            'fields': 'userEnteredFormat.backgroundColor',
-        }},
-
-        # 7. Red for "Cancelled" (row index 4)
-        {'repeatCell': {
-            'range': {'sheetId': sheet_id,
-                      'startRowIndex': 4, 'endRowIndex': 5,
-                      'startColumnIndex': 3, 'endColumnIndex': 4},
-            'cell': {'userEnteredFormat': {
-                'backgroundColor': {'red': 1.0, 'green': 0.85, 'blue': 0.85},
-            }},
-            'fields': 'userEnteredFormat.backgroundColor',
-        }},
-
-        # 8. Borders around the table
+        # 4. Borders around the table
         {'updateBorders': {
             'range': {'sheetId': sheet_id,
                       'startRowIndex': 0, 'endRowIndex': 5,
@@ -125,7 +102,7 @@ def main():
         }},
     ])
 
-    print("Applied 8 formatting operations")
+    print("Applied 4 formatting operations")
     print(f"URL: https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}/edit")
 
 
@@ -7,10 +7,7 @@ Demonstrates:
 - Smart-write pattern (append if data exists, otherwise seed headers)
 """
 
-import os
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
+from _common import SPREADSHEET_ID, get_client
 from sheet_client import SheetsClient, CellData
 
 
@@ -47,11 +44,14 @@ def find_formulas(client: SheetsClient, spreadsheet_id: str,
     result = client.read(spreadsheet_id, [f'{sheet_name}!A1:Z100'],
                          types=CellData.FORMULA)
 
-    formulas = []
-    for row_idx, row in enumerate(result.get('values', [])):
-        for col_idx, cell in enumerate(row):
-            if isinstance(cell, str) and cell.startswith('='):
-                formulas.append((row_idx + 1, col_idx + 1, cell))
+    # Single pass over the values grid; empty rows (returned as []) are
+    # skipped before their cells are touched.
+    formulas = [
+        (row_idx + 1, col_idx + 1, cell)
+        for row_idx, row in enumerate(result.get('values', [])) if row
+        for col_idx, cell in enumerate(row)
+        if isinstance(cell, str) and cell[:1] == '='
+    ]
 
     if not formulas:
         print("No formulas found")
@@ -64,22 +64,29 @@ def find_formulas(client: SheetsClient, spreadsheet_id: str,
 
 def find_data_extent(client: SheetsClient, spreadsheet_id: str,
                      sheet_name: str = 'Sheet1'):
-    """Find the actual rectangle of data in a sheet."""
+    """Find the rectangle of data in a sheet.
+
+    Scans column A and row 1 (plus a 3x3 preview) in one round-trip instead
+    of pulling the whole A:Z block; assumes the table is anchored at A1.
+    """
     print(f"\n=== Data Extent in {sheet_name} ===")
 
-    result = client.read(spreadsheet_id, [f'{sheet_name}!A:Z'])
-    values = result.get('values', [])
-    if not values:
+    result = client.read(spreadsheet_id, [f'{sheet_name}!A:A',
+                                          f'{sheet_name}!1:1',
+                                          f'{sheet_name}!A1:C3'])
+    col_a, row_1, corner = (r.get('values', [])
+                            for r in result.get('valueRanges', [{}, {}, {}]))
+    if not col_a and not row_1:
         print("Sheet is empty")
         return
 
-    last_row = len(values)
-    max_col = max(len(row) for row in values)
+    last_row = len(col_a)
+    max_col = len(row_1[0]) if row_1 else 0
     print(f"Extent: {last_row} rows x {max_col} columns")
 
     print("\nFirst 3x3 cells:")
-    for row_idx in range(min(3, last_row)):
-        print(f"  Row {row_idx + 1}: {values[row_idx][:3]}")
+    for row_idx, row in enumerate(corner):
+        print(f"  Row {row_idx + 1}: {row}")
 
 
 def check_for_data_and_write(client: SheetsClient, spreadsheet_id: str):
@@ -105,8 +112,7 @@ def check_for_data_and_write(client: SheetsClient, spreadsheet_id: str):
 
 
 def main():
-    SPREADSHEET_ID = 'YOUR_SPREADSHEET_ID_HERE'
-    client = SheetsClient()
+    client = get_client()
     analyze_spreadsheet(client, SPREADSHEET_ID)
     find_formulas(client, SPREADSHEET_ID)
     find_data_extent(client, SPREADSHEET_ID)
@@ -0,0 +1,29 @@
+"""Shared setup for the example scripts.
+
+Import this before ``sheet_client``: it makes the package importable from a
+plain checkout, holds the spreadsheet ID, and hands out one ``SheetsClient``
+per process so running several examples together loads the OAuth token and
+opens the HTTPS connection only once.
+"""
+
+try:
+    import sheet_client  # noqa: F401
+except ImportError:  # running from a checkout without `pip install -e .`
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from sheet_client import SheetsClient
+
+# Replace with your spreadsheet ID
+# (from URL: https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}/edit)
+SPREADSHEET_ID = 'YOUR_SPREADSHEET_ID_HERE'
+
+
+def get_client() -> SheetsClient:
+    """Return the process-wide client, building it on first call.
+
+    The client takes no spreadsheet_id — pass it to each method. First run
+    opens a browser for OAuth; later runs reuse the cached token.
+    """
+    return SheetsClient.get()
@@ -39,14 +39,22 @@ Sheet names containing ':', '!', '.', spaces, or "'" must be single-quoted:
     SID:'My Sheet'!A1
 """
 
+from __future__ import annotations
+
+import functools
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from sheet_cli import dispatch, verbs
+# sheet_client (and the verbs built on it) pull in googleapiclient, httplib2
+# and google-auth — a couple of hundred ms at startup. They are imported on
+# first use, so tools/list and protocol errors are served without them.
 from sheet_cli.grammar import (
     GrammarError,
     Target,
@@ -55,42 +63,50 @@ from sheet_cli.grammar import (
     parse,
     resolve,
 )
-from sheet_client import SheetsClient
 
+if TYPE_CHECKING:
+    from sheet_client import SheetsClient
 
-def _parse_first(s: str) -> Target:
-    """Parse a first-operand target. Empty string is DRIVE."""
-    parsed = parse(s or "")
-    if parsed.is_empty:
-        return Target(None, None, None)
-    if parsed.spreadsheet_id is None:
-        raise GrammarError(f"target must include a spreadsheet ID: {s!r}")
-    return Target(parsed.spreadsheet_id, parsed.sheet, parsed.locator, parsed.property)
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
 
 
-def _parse_second(s: str, parent: Target) -> Target:
-    return resolve(parent, parse(s or ""))
+_READ_CHUNK = 1 << 16
 
+# tools/call requests run on a small worker pool so independent Sheets round
+# trips overlap instead of queueing behind each other on the stdin loop.
+_MAX_WORKERS = 4
 
-class MCPSheetsServer:
-    """MCP server exposing the unified six-verb grammar over Google Sheets."""
+# Responses go straight to fd 1 with os.write — one syscall per frame, no
+# TextIOWrapper/BufferedWriter layers. Nothing else in the server prints.
+_STDOUT_FD = 1
+_STDOUT_LOCK = threading.Lock()
 
-    def __init__(self):
-        self.client: Optional[SheetsClient] = None
+_PRETTY = bool(os.environ.get("MCP_PRETTY"))
 
-    def initialize(self):
-        if self.client is None:
-            self.client = SheetsClient()
+# How long a cached meta_read() response stays valid. Structure changes made
+# through this server invalidate immediately; the TTL only bounds staleness
+# from edits made elsewhere (browser, other clients).
+_META_TTL = 30.0
 
-    # ------------------------------------------------------------------
-    # tool catalog
-    # ------------------------------------------------------------------
+# Sheets API per-minute quotas. Requests are paced below these instead of
+# running into 429s and paying exponential backoff on every burst.
+_READS_PER_MIN = 300
+_WRITES_PER_MIN = 60
 
-    def get_tools(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "name": "sheets_get",
-                "description": """Read from a target. Returns raw Google API responses.
+
+# ----------------------------------------------------------------------
+# tool catalog
+# ----------------------------------------------------------------------
+
+# Static schema, built once at import. tools/list serves the pre-serialized
+# form below instead of re-walking this structure on every call.
+_TOOLS: List[Dict[str, Any]] = [
+    {
+        "name": "sheets_get",
+        "description": """Read from a target. Returns raw Google API responses.
 
 TARGET SHAPES:
 - '' (empty)              → Drive listing (list of spreadsheets the user can see)
@@ -119,27 +135,27 @@ FORMAT:
 BEST PRACTICES:
 - For complex analysis of many cells, request 'json' and parse the structure directly
 - For quick inspection (< 50 cells), 'text' is more compact""",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "target": {
-                            "type": "string",
-                            "description": "Target string. Empty for Drive listing.",
-                            "default": "",
-                        },
-                        "format": {
-                            "type": "string",
-                            "enum": ["json", "text"],
-                            "default": "json",
-                            "description": "Output format. DRIVE/SPREADSHEET always return JSON.",
-                        },
-                    },
-                    "required": [],
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "target": {
+                    "type": "string",
+                    "description": "Target string. Empty for Drive listing.",
+                    "default": "",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["json", "text"],
+                    "default": "json",
+                    "description": "Output format. DRIVE/SPREADSHEET always return JSON.",
                 },
             },
-            {
-                "name": "sheets_put",
-                "description": """Write cells (or properties) to a target. Batches into one API call.
+            "required": [],
+        },
+    },
+    {
+        "name": "sheets_put",
+        "description": """Write cells (or properties) to a target. Batches into one API call.
 
 DATA SHAPES (cell writes):
 - {"A1": "hello", "B1": 42}              — cell-keyed dict, each becomes a 1x1 write
@@ -169,23 +185,23 @@ Property responses are always JSON. Use sheets_get '.property' first to inspect
 
 BULK WRITES (10+ cells): generate the full dict programmatically and send in ONE call.
 A single sheets_put scales to thousands of cells — do NOT loop over sheets_put.""",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "target": {
-                            "type": "string",
-                            "description": "Target string (cell, range, or sheet).",
-                        },
-                        "data": {
-                            "description": "Cell-keyed dict, range-keyed dict, 2D array, or scalar.",
-                        },
-                    },
-                    "required": ["target", "data"],
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "target": {
+                    "type": "string",
+                    "description": "Target string (cell, range, or sheet).",
+                },
+                "data": {
+                    "description": "Cell-keyed dict, range-keyed dict, 2D array, or scalar.",
                 },
             },
-            {
-                "name": "sheets_del",
-                "description": """Delete or clear what's at the target.
+            "required": ["target", "data"],
+        },
+    },
+    {
+        "name": "sheets_del",
+        "description": """Delete or clear what's at the target.
 
 BEHAVIOR BY TARGET TYPE:
 - SPREADSHEET   → Drive delete (moves to trash)
@@ -204,20 +220,20 @@ PROPERTY DELETES (.property suffix): reset / clear the property in place
 - '.conditional' (no key) → delete every rule on the sheet
 - '.conditional[i]' → delete that rule
 - '.parents.FOLDER_ID' → detach from that folder (unkeyed '.parents' is refused — would orphan the file)""",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "target": {
-                            "type": "string",
-                            "description": "Target string.",
-                        },
-                    },
-                    "required": ["target"],
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "target": {
+                    "type": "string",
+                    "description": "Target string.",
                 },
             },
-            {
-                "name": "sheets_new",
-                "description": """Create a new spreadsheet, sheet, row, column, or collection element.
+            "required": ["target"],
+        },
+    },
+    {
+        "name": "sheets_new",
+        "description": """Create a new spreadsheet, sheet, row, column, or collection element.
 
 BEHAVIOR BY TARGET:
 - '' or 'Title'        → new spreadsheet (target is treated as the title)
@@ -237,29 +253,29 @@ PROPERTY APPENDS (collections only — pass `data`):
 - 'SID.parents'             → data = folder-ID string or list (ADDS folders without removing existing)
 
 Use sheets_put for non-collection property writes.""",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "target": {
-                            "type": "string",
-                            "default": "",
-                            "description": "Target or title.",
-                        },
-                        "side": {
-                            "type": "string",
-                            "enum": ["above", "below", "left", "right"],
-                            "description": "For row/column targets only.",
-                        },
-                        "data": {
-                            "description": "Body for property appends (.conditional rule, .named A1/GridRange, .merge type, .protected spec). Ignored for non-property targets.",
-                        },
-                    },
-                    "required": [],
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "target": {
+                    "type": "string",
+                    "default": "",
+                    "description": "Target or title.",
+                },
+                "side": {
+                    "type": "string",
+                    "enum": ["above", "below", "left", "right"],
+                    "description": "For row/column targets only.",
+                },
+                "data": {
+                    "description": "Body for property appends (.conditional rule, .named A1/GridRange, .merge type, .protected spec). Ignored for non-property targets.",
                 },
             },
-            {
-                "name": "sheets_copy",
-                "description": """Copy source to dest. Uses server-side APIs when possible.
+            "required": [],
+        },
+    },
+    {
+        "name": "sheets_copy",
+        "description": """Copy source to dest. Uses server-side APIs when possible.
 
 DISPATCH TABLE:
 - same spreadsheet, RANGE→RANGE     → copyPaste   (server-side, no data transfer)
@@ -273,18 +289,18 @@ INHERITANCE: dest can omit components to inherit from source:
 - ':Sheet2'      → same SID, different sheet
 
 NOT SUPPORTED for .property targets — use sheets_get + sheets_put to copy a property value.""",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "source": {"type": "string", "description": "Source target."},
-                        "dest": {"type": "string", "description": "Destination target (may inherit from source)."},
-                    },
-                    "required": ["source", "dest"],
-                },
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "source": {"type": "string", "description": "Source target."},
+                "dest": {"type": "string", "description": "Destination target (may inherit from source)."},
             },
-            {
-                "name": "sheets_move",
-                "description": """Move source to dest. Uses server-side APIs when possible.
+            "required": ["source", "dest"],
+        },
+    },
+    {
+        "name": "sheets_move",
+        "description": """Move source to dest. Uses server-side APIs when possible.
 
 DISPATCH TABLE:
 - same sheet, ROW/COL              → moveDimension (server-side)
@@ -293,18 +309,18 @@ DISPATCH TABLE:
 
 Same inheritance rules as sheets_copy.
 NOT SUPPORTED for .property targets.""",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "source": {"type": "string", "description": "Source target."},
-                        "dest": {"type": "string", "description": "Destination target (may inherit from source)."},
-                    },
-                    "required": ["source", "dest"],
-                },
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "source": {"type": "string", "description": "Source target."},
+                "dest": {"type": "string", "description": "Destination target (may inherit from source)."},
             },
-            {
-                "name": "sheets_batch_update",
-                "description": """Raw spreadsheets.batchUpdate escape hatch for operations that don't fit the verb grammar:
+            "required": ["source", "dest"],
+        },
+    },
+    {
+        "name": "sheets_batch_update",
+        "description": """Raw spreadsheets.batchUpdate escape hatch for operations that don't fit the verb grammar:
 formatting (repeatCell, updateCells), conditional rules, merges, protected ranges,
 named ranges, auto-resize, find/replace, sortRange, etc.
 
@@ -313,66 +329,228 @@ CALL sheets_get 'SID' FIRST to discover sheetId values needed in GridRange objec
 BATCH MULTIPLE REQUESTS in one call — one formatting operation per call is wasteful.
 
 Reference: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request""",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "spreadsheet_id": {"type": "string"},
-                        "requests": {
-                            "type": "array",
-                            "items": {"type": "object"},
-                            "description": "Array of Request objects (addSheet, repeatCell, etc.).",
-                        },
-                    },
-                    "required": ["spreadsheet_id", "requests"],
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {"type": "string"},
+                "requests": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Array of Request objects (addSheet, repeatCell, etc.).",
                 },
             },
-        ]
+            "required": ["spreadsheet_id", "requests"],
+        },
+    },
+]
+
+# ----------------------------------------------------------------------
+# JSON codec — orjson when installed (several times faster on large reads,
+# and works in bytes end to end), stdlib json otherwise. Both emit compact
+# UTF-8.
+# ----------------------------------------------------------------------
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        opts = _ORJSON_OPTS | orjson.OPT_INDENT_2 if pretty else _ORJSON_OPTS
+        return orjson.dumps(obj, default=str, option=opts)
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            text = json.dumps(obj, indent=2, default=str, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), default=str, ensure_ascii=False)
+        return text.encode()
+
+    _loads = json.loads
+
+
+_TOOLS_LIST_RESULT = _dumps({"tools": _TOOLS})
+
+# Framing for the read loop's error paths — only the message varies, so it is
+# the only part serialized. Hot when a client falls out of sync.
+_PARSE_ERROR = b'{"jsonrpc":"2.0","id":null,"error":{"code":-32700,"message":%s}}'
+_INTERNAL_ERROR = b'{"jsonrpc":"2.0","id":null,"error":{"code":-32603,"message":%s}}'
+
+_INIT_RESULT: Dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "serverInfo": {"name": "sheets-mcp-server", "version": "2.0.0"},
+    "capabilities": {"tools": {}},
+}
+
+
+def _parse_first(s: str) -> Target:
+    """Parse a first-operand target. Empty string is DRIVE."""
+    parsed = parse(s or "")
+    if parsed.is_empty:
+        return Target(None, None, None)
+    if parsed.spreadsheet_id is None:
+        raise GrammarError(f"target must include a spreadsheet ID: {s!r}")
+    return Target(parsed.spreadsheet_id, parsed.sheet, parsed.locator, parsed.property)
+
+
+def _parse_second(s: str, parent: Target) -> Target:
+    return resolve(parent, parse(s or ""))
+
+
+class _TokenBucket:
+    """Thread-safe token bucket; ``acquire()`` blocks until a token is free.
+
+    Tokens are reserved before sleeping (the count may go negative), so
+    concurrent callers queue up in order instead of all waking at once.
+    """
+
+    def __init__(self, per_minute: int):
+        self._rate = per_minute / 60.0
+        self._capacity = float(per_minute)
+        self._tokens = float(per_minute)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity,
+                               self._tokens + (now - self._stamp) * self._rate)
+            self._stamp = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+@functools.lru_cache(maxsize=None)
+def _session_client_class() -> type:
+    """Build ``_SessionClient`` on first use; see the lazy-import note above."""
+    from sheet_client import SheetsClient
+
+    class _SessionClient(SheetsClient):
+        """SheetsClient with the server's shared per-session state.
+
+        - meta_read() results (and sheet_id()'s title map) live in one
+          metadata cache shared by every worker thread's client, for up to
+          _META_TTL seconds. Nearly every verb resolves sheet titles to
+          sheetIds, so an agent session would otherwise re-fetch the same
+          metadata dozens of times. Structure changes through any of them
+          drop the affected spreadsheet's entries.
+        - Every API request takes a token from the read (GET) or write bucket
+          first, keeping the session under the Sheets per-minute quotas.
+        """
+
+        def __init__(self, meta_cache: Dict[str, Any],
+                     read_bucket: _TokenBucket, write_bucket: _TokenBucket):
+            super().__init__(meta_ttl=_META_TTL, meta_cache=meta_cache)
+            self._read_bucket = read_bucket
+            self._write_bucket = write_bucket
+
+        def _execute_with_retry(self, request, max_retries: int = 3) -> Any:
+            if getattr(request, "method", "GET") == "GET":
+                self._read_bucket.acquire()
+            else:
+                self._write_bucket.acquire()
+            return super()._execute_with_retry(request, max_retries)
+
+    return _SessionClient
+
+
+class MCPSheetsServer:
+    """MCP server exposing the unified six-verb grammar over Google Sheets."""
+
+    def __init__(self):
+        self.client: Optional[SheetsClient] = None
+        self._local = threading.local()
+        self._meta_cache: Dict[str, Any] = {}
+        self._read_bucket = _TokenBucket(_READS_PER_MIN)
+        self._write_bucket = _TokenBucket(_WRITES_PER_MIN)
+        self._pool = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+        self._dispatch = {
+            "initialize": self._h_init,
+            "tools/list": self._h_list,
+            "tools/call": self._h_call,
+        }
+        self._tools = {
+            "sheets_get": self._tool_get,
+            "sheets_put": self._tool_put,
+            "sheets_del": self._tool_del,
+            "sheets_new": self._tool_new,
+            "sheets_copy": self._tool_copy,
+            "sheets_move": self._tool_move,
+            "sheets_batch_update": self._tool_batch_update,
+        }
+
+    def initialize(self):
+        self.client = self._client()
+
+    def _client(self) -> SheetsClient:
+        """Return the calling thread's SheetsClient, building it on first use.
+
+        httplib2 connections are not thread-safe, so each worker thread gets
+        its own client (and its own keep-alive pool).
+        """
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = _session_client_class()(
+                self._meta_cache, self._read_bucket, self._write_bucket)
+        return client
+
+    def get_tools(self) -> List[Dict[str, Any]]:
+        return _TOOLS
 
     # ------------------------------------------------------------------
     # dispatch
     # ------------------------------------------------------------------
 
     def execute_tool(self, name: str, args: Dict[str, Any]) -> Any:
-        self.initialize()
-        assert self.client is not None
-
-        if name == "sheets_get":
-            target = _parse_first(args.get("target", ""))
-            response = verbs.do_get(self.client, target)
-            if args.get("format") == "text":
-                return _format_as_text(target, response)
-            return response
-
-        if name == "sheets_put":
-            target = _parse_first(args["target"])
-            return verbs.do_put(self.client, target, args["data"])
-
-        if name == "sheets_del":
-            target = _parse_first(args["target"])
-            return verbs.do_del(self.client, target)
-
-        if name == "sheets_new":
-            target = _parse_first(args.get("target", ""))
-            return verbs.do_new(
-                self.client, target,
-                side=args.get("side"),
-                data=args.get("data"),
-            )
-
-        if name == "sheets_copy":
-            source = _parse_first(args["source"])
-            dest = _parse_second(args["dest"], source)
-            return dispatch.do_copy(self.client, source, dest)
-
-        if name == "sheets_move":
-            source = _parse_first(args["source"])
-            dest = _parse_second(args["dest"], source)
-            return dispatch.do_move(self.client, source, dest)
-
-        if name == "sheets_batch_update":
-            return self.client.meta_write(args["spreadsheet_id"], args["requests"])
-
-        raise ValueError(f"unknown tool: {name}")
+        tool = self._tools.get(name)
+        if tool is None:
+            raise ValueError(f"unknown tool: {name}")
+        return tool(self._client(), args)
+
+    def _tool_get(self, client: SheetsClient, args: Dict[str, Any]) -> Any:
+        from sheet_cli import verbs
+        target = _parse_first(args.get("target", ""))
+        response = verbs.do_get(client, target)
+        if args.get("format") == "text":
+            return _format_as_text(target, response)
+        return response
+
+    def _tool_put(self, client: SheetsClient, args: Dict[str, Any]) -> Any:
+        from sheet_cli import verbs
+        target = _parse_first(args["target"])
+        return verbs.do_put(client, target, args["data"])
+
+    def _tool_del(self, client: SheetsClient, args: Dict[str, Any]) -> Any:
+        from sheet_cli import verbs
+        target = _parse_first(args["target"])
+        return verbs.do_del(client, target)
+
+    def _tool_new(self, client: SheetsClient, args: Dict[str, Any]) -> Any:
+        from sheet_cli import verbs
+        target = _parse_first(args.get("target", ""))
+        return verbs.do_new(
+            client, target,
+            side=args.get("side"),
+            data=args.get("data"),
+        )
+
+    def _tool_copy(self, client: SheetsClient, args: Dict[str, Any]) -> Any:
+        from sheet_cli import dispatch
+        source = _parse_first(args["source"])
+        dest = _parse_second(args["dest"], source)
+        return dispatch.do_copy(client, source, dest)
+
+    def _tool_move(self, client: SheetsClient, args: Dict[str, Any]) -> Any:
+        from sheet_cli import dispatch
+        source = _parse_first(args["source"])
+        dest = _parse_second(args["dest"], source)
+        return dispatch.do_move(client, source, dest)
+
+    def _tool_batch_update(self, client: SheetsClient, args: Dict[str, Any]) -> Any:
+        return client.meta_write(args["spreadsheet_id"], args["requests"])
 
     # ------------------------------------------------------------------
     # JSON-RPC
@@ -380,63 +558,110 @@ Reference: https://developers.google.com/sheets/api/reference/rest/v4/spreadshee
 
     def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         method = request.get("method")
-        params = request.get("params", {})
         request_id = request.get("id")
+        handler = self._dispatch.get(method)
+        if handler is None:
+            return _rpc_error(request_id, -32601, f"method not found: {method}")
+        return handler(request_id, request.get("params", {}))
 
-        if method == "initialize":
-            self.initialize()
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "serverInfo": {"name": "sheets-mcp-server", "version": "2.0.0"},
-                    "capabilities": {"tools": {}},
-                },
-            }
-
-        if method == "tools/list":
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {"tools": self.get_tools()},
-            }
-
-        if method == "tools/call":
-            tool_name = params.get("name")
-            arguments = params.get("arguments", {})
-            try:
-                result = self.execute_tool(tool_name, arguments)
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "content": [
-                            {"type": "text", "text": result if isinstance(result, str)
-                             else json.dumps(result, indent=2, default=str)}
-                        ]
-                    },
-                }
-            except GrammarError as e:
-                return _rpc_error(request_id, -32602, f"grammar error: {e}")
-            except Exception as e:
-                return _rpc_error(request_id, -32603, str(e))
-
-        return _rpc_error(request_id, -32601, f"method not found: {method}")
+    def _h_init(self, request_id, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.initialize()
+        return {"jsonrpc": "2.0", "id": request_id, "result": _INIT_RESULT}
+
+    def _h_list(self, request_id, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": request_id,
+                "result": {"tools": self.get_tools()}}
+
+    def _h_call(self, request_id, params: Dict[str, Any]) -> Dict[str, Any]:
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
+        try:
+            result = self.execute_tool(tool_name, arguments)
+        except GrammarError as e:
+            return _rpc_error(request_id, -32602, f"grammar error: {e}")
+        except Exception as e:
+            return _rpc_error(request_id, -32603, str(e))
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": {
+                "content": [
+                    {"type": "text", "text": result if isinstance(result, str)
+                     else _dumps_result(result)}
+                ]
+            },
+        }
 
     def run(self):
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                request = json.loads(line)
-                response = self.handle_request(request)
-                print(json.dumps(response), flush=True)
-            except json.JSONDecodeError as e:
-                print(json.dumps(_rpc_error(None, -32700, f"parse error: {e}")), flush=True)
-            except Exception as e:
-                print(json.dumps(_rpc_error(None, -32603, f"internal error: {e}")), flush=True)
+        """Serve newline-delimited JSON-RPC on stdin/stdout.
+
+        Reads raw bytes in large chunks and splits frames on b"\n" — several
+        queued requests are peeled off one read, and the decoder takes bytes
+        directly, so there is no per-line text decode.
+        """
+        stdin = sys.stdin.buffer
+        pending = b""
+        while True:
+            chunk = stdin.read1(_READ_CHUNK)
+            if not chunk:
+                break
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                self._serve_line(line)
+        self._serve_line(pending)
+        self._pool.shutdown(wait=True)
+
+    def _serve_line(self, line: bytes) -> None:
+        line = line.strip()
+        if not line:
+            return
+        try:
+            request = _loads(line)
+        except json.JSONDecodeError as e:  # orjson's error subclasses this
+            _write_line(_PARSE_ERROR % _dumps(f"parse error: {e}"))
+            return
+        # Tool calls hit the network; run them off the read loop and answer
+        # in completion order (JSON-RPC matches responses by id).
+        if isinstance(request, dict) and request.get("method") == "tools/call":
+            self._pool.submit(self._serve_request, request)
+        else:
+            self._serve_request(request)
+
+    def _serve_request(self, request: Any) -> None:
+        if isinstance(request, dict) and request.get("method") == "tools/list":
+            request_id = _dumps(request.get("id"))
+            _write_line(b'{"jsonrpc":"2.0","id":%s,"result":%s}'
+                        % (request_id, _TOOLS_LIST_RESULT))
+            return
+        try:
+            response = self.handle_request(request)
+        except Exception as e:
+            _write_line(_INTERNAL_ERROR % _dumps(f"internal error: {e}"))
+            return
+        _write_response(response)
+
+
+def _dumps_result(result: Any) -> str:
+    """Serialize a tool result for the ``text`` content block.
+
+    Compact by default — the MCP client re-parses it, and indentation roughly
+    doubles the bytes of a large read. Set MCP_PRETTY=1 to indent for
+    debugging.
+    """
+    return _dumps(result, pretty=_PRETTY).decode()
+
+
+def _write_response(response: Dict[str, Any]) -> None:
+    _write_line(_dumps(response))
+
+
+def _write_line(payload: bytes) -> None:
+    data = memoryview(payload + b"\n")
+    with _STDOUT_LOCK:
+        # A pipe may take a large frame in pieces; finish it before releasing.
+        while data:
+            data = data[os.write(_STDOUT_FD, data):]
 
 
 def _rpc_error(request_id, code: int, message: str) -> Dict[str, Any]:
@@ -453,10 +678,10 @@ def _format_as_text(target: Target, response: Any) -> str:
     Properties always return JSON (their responses aren't cell-shaped).
     """
     if target.property is not None:
-        return json.dumps(response, indent=2, default=str)
+        return _dumps_result(response)
     tt = classify(target)
     if tt in (TargetType.DRIVE, TargetType.SPREADSHEET):
-        return json.dumps(response, indent=2, default=str)
+        return _dumps_result(response)
 
     # Collect (range_str, values) pairs
     pairs = []
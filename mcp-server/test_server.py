@@ -28,13 +28,13 @@ EXPECTED_TOOLS = [
 
 def send_request(process, request):
     assert process.stdin is not None and process.stdout is not None
-    line = json.dumps(request) + "\n"
-    process.stdin.write(line)
+    # Binary pipes: one encoded frame per request, no text-codec layer.
+    process.stdin.write(json.dumps(request).encode() + b"\n")
     process.stdin.flush()
     response = process.stdout.readline()
     if not response.strip():
         assert process.stderr is not None
-        err = process.stderr.read()
+        err = process.stderr.read().decode(errors="replace")
         raise RuntimeError(f"empty response; stderr:\n{err}")
     return json.loads(response)
 
@@ -47,8 +47,7 @@ def test_mcp_server():
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
+        bufsize=-1,
         cwd=PROJECT_ROOT,
     )
 
@@ -19,7 +19,9 @@ setup(
     python_requires='>=3.8',
     install_requires=requirements,
     extras_require={
-        'test': ['pytest>=7.0'],
+        'test': ['pytest>=7.0', 'pytest-xdist>=3.0'],
+        'speedups': ['orjson>=3.0'],
+        'streaming': ['ijson>=3.1'],
     },
     entry_points={
         'console_scripts': [
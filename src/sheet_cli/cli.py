@@ -27,16 +27,15 @@ Output rules:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from sheet_client import SheetsClient
 from sheet_client.auth import get_credentials
 from sheet_client.exceptions import AuthenticationError, SheetsClientError
 
-from . import dispatch, formats, verbs
+from . import daemon, dispatch, formats, verbs
 from .grammar import (
     GrammarError,
     Target,
@@ -71,7 +70,7 @@ def _parse_second(s: str, parent: Target) -> Target:
 
 
 def _print_json(obj: Any) -> None:
-    print(json.dumps(obj, indent=2, default=str))
+    print(formats.dump_json(obj))
 
 
 def _emit_get(target: Target, response: Any, as_json: bool) -> None:
@@ -96,8 +95,7 @@ def _emit_get(target: Target, response: Any, as_json: bool) -> None:
     flat = {}
     for range_str, values in value_ranges:
         flat.update(formats.expand_range_to_cells(range_str, values))
-    if flat:
-        print(formats.format_cell_value_pairs(flat))
+    formats.write_cell_value_pairs(flat, sys.stdout)
 
 
 def _normalize_value_ranges(response):
@@ -125,18 +123,30 @@ def _read_data_from_stdin() -> Optional[Any]:
     return formats.parse_input(text)
 
 
+# --------------------------------- client ----------------------------------
+
+
+# Set by ``sheet-cli serve`` so every forwarded command reuses one
+# authenticated client and its keep-alive connection.
+_shared_client: Optional[SheetsClient] = None
+
+
+def _client() -> SheetsClient:
+    return _shared_client if _shared_client is not None else SheetsClient()
+
+
 # --------------------------------- verbs -----------------------------------
 
 
 def cmd_get(args):
-    client = SheetsClient()
+    client = _client()
     target = _parse_target(args.target or "")
     response = verbs.do_get(client, target)
     _emit_get(target, response, args.format == "json")
 
 
 def cmd_put(args):
-    client = SheetsClient()
+    client = _client()
     target = _parse_target(args.target)
 
     if args.value is not None:
@@ -155,14 +165,14 @@ def cmd_put(args):
 
 
 def cmd_del(args):
-    client = SheetsClient()
+    client = _client()
     target = _parse_target(args.target)
     response = verbs.do_del(client, target)
     _emit_mutation(target, response, args.format == "json")
 
 
 def cmd_new(args):
-    client = SheetsClient()
+    client = _client()
     target = _parse_target(args.target or "")
     # Property collections (e.g. `.conditional`, `.named`) take a body from stdin.
     data = _read_data_from_stdin() if target.property is not None else None
@@ -172,7 +182,7 @@ def cmd_new(args):
 
 
 def cmd_copy(args):
-    client = SheetsClient()
+    client = _client()
     source = _parse_target(args.source)
     dest = _parse_second(args.dest, source)
     response = dispatch.do_copy(client, source, dest)
@@ -180,7 +190,7 @@ def cmd_copy(args):
 
 
 def cmd_move(args):
-    client = SheetsClient()
+    client = _client()
     source = _parse_target(args.source)
     dest = _parse_second(args.dest, source)
     response = dispatch.do_move(client, source, dest)
@@ -228,10 +238,55 @@ def cmd_auth(args):
     print("Authentication successful. Token cached at ~/.sheet-cli/token.json")
 
 
+# -------------------------------- daemon ----------------------------------
+
+
+# Verbs a running ``sheet-cli serve`` answers; auth/help/serve stay local.
+_FORWARDED = frozenset({"get", "put", "del", "new", "copy", "move"})
+
+
+def _stdin_for_daemon(args) -> Optional[bytes]:
+    """Piped stdin the command would read, or None (sent as "no stdin")."""
+    if args.command == "put" and args.value is None:
+        wants = True
+    elif args.command == "new":
+        try:
+            wants = _parse_target(args.target or "").property is not None
+        except GrammarError:
+            wants = False  # the daemon reports the grammar error
+    else:
+        wants = False
+    if not wants or sys.stdin.isatty():
+        return None
+    return sys.stdin.buffer.read()
+
+
+def _try_daemon(argv: List[str], args) -> bool:
+    """Run the command on a live daemon; False if none is listening."""
+    reply = daemon.forward(argv, lambda: _stdin_for_daemon(args))
+    if reply is None:
+        return False
+    sys.stdout.write(reply["stdout"])
+    sys.stderr.write(reply["stderr"])
+    if reply["code"]:
+        sys.exit(reply["code"])
+    return True
+
+
+def cmd_serve(args):
+    daemon.serve(args.socket)
+
+
 # --------------------------------- main -----------------------------------
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
+    """Run the CLI on ``argv`` (default ``sys.argv[1:]``).
+
+    Invoked from the command line, verb commands go to a running
+    ``sheet-cli serve`` daemon when one is listening. An explicit ``argv``
+    (the daemon's own entry) always runs in-process.
+    """
     parser = argparse.ArgumentParser(
         prog="sheet-cli",
         description="Google Sheets & Drive — unified six-verb CLI.",
@@ -290,12 +345,25 @@ def main():
     p_help = sub.add_parser("help", help="show full reference and exit")
     p_help.set_defaults(func=lambda _a: cmd_help())
 
-    args = parser.parse_args()
+    p_serve = sub.add_parser(
+        "serve", help="keep one authenticated client alive for later commands")
+    p_serve.add_argument("--socket", default=None,
+                         help="UNIX socket path (default: $SHEET_CLI_SOCKET "
+                              "or ~/.sheet-cli/sock)")
+    p_serve.set_defaults(func=cmd_serve)
+
+    forwardable = argv is None
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parser.parse_args(argv)
 
     if args.show_help or args.command is None:
         cmd_help()
         return
 
+    if forwardable and args.command in _FORWARDED and _try_daemon(argv, args):
+        return
+
     try:
         args.func(args)
     except GrammarError as e:
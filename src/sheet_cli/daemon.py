@@ -0,0 +1,185 @@
+"""Persistent ``sheet-cli serve`` mode.
+
+Each CLI invocation otherwise loads OAuth credentials, builds the API
+services and opens a fresh TLS connection before doing any work. For shell
+loops that cost dwarfs the API call itself. ``sheet-cli serve`` keeps one
+authenticated ``SheetsClient`` (and its keep-alive connection) in a
+long-lived process listening on a UNIX socket; while it is up, verb commands
+forward their argv and stdin to it and print what it sends back.
+
+Wire format: the client sends one JSON object ``{"argv": [...], "stdin":
+<base64 or null>}`` and half-closes; the server replies with ``{"stdout":
+str, "stderr": str, "code": int}`` and closes. Requests are served one at a
+time.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+SOCKET_ENV = "SHEET_CLI_SOCKET"
+DEFAULT_SOCKET = Path.home() / ".sheet-cli" / "sock"
+
+
+def socket_path() -> str:
+    """Daemon socket: ``$SHEET_CLI_SOCKET`` or ``~/.sheet-cli/sock``."""
+    return os.environ.get(SOCKET_ENV) or str(DEFAULT_SOCKET)
+
+
+# ------------------------------- client side -------------------------------
+
+
+def forward(argv: List[str],
+            read_stdin: Callable[[], Optional[bytes]]) -> Optional[Dict[str, Any]]:
+    """Run ``argv`` on a live daemon; None if there is none to talk to.
+
+    ``read_stdin`` is called only once connected, so stdin is still unread
+    when the command falls back to running in-process. A missing or stale
+    socket is not an error.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path()
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    with sock:
+        return _request(sock, argv, read_stdin())
+
+
+def _request(sock: socket.socket, argv: List[str],
+             stdin: Optional[bytes]) -> Dict[str, Any]:
+    payload = {
+        "argv": argv,
+        "stdin": None if stdin is None else base64.b64encode(stdin).decode("ascii"),
+    }
+    sock.sendall(json.dumps(payload).encode())
+    sock.shutdown(socket.SHUT_WR)
+    return json.loads(_recv_all(sock))
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    chunks = []
+    while True:
+        chunk = sock.recv(1 << 16)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+# ------------------------------- server side -------------------------------
+
+
+class _Stdin(io.TextIOWrapper):
+    """Forwarded stdin; a tty when the client sent none."""
+
+    def __init__(self, data: Optional[bytes]):
+        super().__init__(io.BytesIO(data or b""))
+        self._tty = data is None
+
+    def isatty(self) -> bool:
+        return self._tty
+
+
+def serve(path: Optional[str] = None) -> None:
+    """Authenticate once, then answer forwarded commands until interrupted."""
+    from . import cli
+
+    path = path or socket_path()
+    if _is_listening(path):
+        raise SystemExit(f"serve: a daemon is already listening on {path}")
+
+    # Build (and authenticate) the shared client before accepting anything,
+    # so an OAuth prompt never happens inside a forwarded command.
+    cli._shared_client = cli.SheetsClient()
+    cli._shared_client.connect()
+
+    Path(path).parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)  # stale socket from a previous run
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket is user-only (mode 600)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    print(f"sheet-cli: serving on {path}", file=sys.stderr, flush=True)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                _handle(conn)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        cli._shared_client = None
+
+
+def _is_listening(path: str) -> bool:
+    """True if something is accepting connections on ``path``."""
+    if not os.path.exists(path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def _handle(conn: socket.socket) -> None:
+    try:
+        request = json.loads(_recv_all(conn))
+        stdin = request.get("stdin")
+        reply = _run(request["argv"],
+                     None if stdin is None else base64.b64decode(stdin))
+    except Exception as e:  # malformed request — report it, keep serving
+        reply = {"stdout": "", "stderr": f"sheet-cli serve: bad request: {e}\n",
+                 "code": 1}
+    with contextlib.suppress(OSError):
+        conn.sendall(json.dumps(reply).encode())
+
+
+def _run(argv: List[str], stdin: Optional[bytes]) -> Dict[str, Any]:
+    """Run one CLI command in-process, capturing its output and exit code."""
+    from . import cli
+
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    saved_stdin = sys.stdin
+    sys.stdin = _Stdin(stdin)
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                cli.main(argv)
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    code = e.code
+                elif e.code is not None:
+                    print(e.code, file=sys.stderr)
+                    code = 1
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        sys.stdin = saved_stdin
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "code": code}
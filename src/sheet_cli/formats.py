@@ -1,8 +1,38 @@
 """Format handling for CLI input/output."""
 
 import json
+import re
 import sys
-from typing import Dict, List, Any, Tuple, Union
+from typing import Dict, Iterator, List, Any, TextIO, Tuple, Union
+
+from sheet_client.utils import _parse_a1, index_to_column
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:  # second-choice decoder where orjson can't be installed
+    ujson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def dump_json(obj: Any) -> str:
+        """Serialize ``obj`` as 2-space indented JSON (non-JSON types via str)."""
+        return orjson.dumps(
+            obj, default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+else:
+    _json_loads = ujson.loads if ujson is not None else json.loads
+
+    def dump_json(obj: Any) -> str:
+        """Serialize ``obj`` as 2-space indented JSON (non-JSON types via str)."""
+        return json.dumps(obj, indent=2, default=str)
 
 
 def parse_cell_value_pairs(text: str) -> Dict[str, Any]:
@@ -24,17 +54,16 @@ def parse_cell_value_pairs(text: str) -> Dict[str, Any]:
     """
     result = {}
 
-    for line in text.strip().split('\n'):
+    for line in text.splitlines():
         line = line.strip()
         if not line:
             continue
 
         # Split on first space only
-        parts = line.split(' ', 1)
-        if len(parts) != 2:
+        cell, sep, value = line.partition(' ')
+        if not sep:
             raise ValueError(f"Invalid format: '{line}'. Expected 'cell value'")
 
-        cell, value = parts
         result[cell] = value
 
     return result
@@ -53,13 +82,22 @@ def format_cell_value_pairs(data: Dict[str, Any]) -> str:
         >>> format_cell_value_pairs({'A1': 'hello', 'A2': 123, 'A3': '=SUM(A1:A2)'})
         'A1 hello\\nA2 123\\nA3 =SUM(A1:A2)'
     """
-    lines = []
-    for cell, value in data.items():
-        # Convert value to string, preserve formulas
-        value_str = str(value) if value is not None else ''
-        lines.append(f"{cell} {value_str}")
+    return '\n'.join(_cell_value_lines(data))
+
 
-    return '\n'.join(lines)
+def write_cell_value_pairs(data: Dict[str, Any], stream: TextIO) -> None:
+    """Write cell/value pairs to ``stream``, one newline-terminated line each.
+
+    Same text as ``format_cell_value_pairs`` plus a trailing newline, handed
+    to ``stream.writelines`` without first joining a full-sheet string.
+    """
+    stream.writelines(f"{line}\n" for line in _cell_value_lines(data))
+
+
+def _cell_value_lines(data: Dict[str, Any]) -> Iterator[str]:
+    # Convert value to string, preserve formulas
+    for cell, value in data.items():
+        yield f"{cell} {'' if value is None else value}"
 
 
 def expand_range_to_cells(range_str: str, values: List[List[Any]]) -> Dict[str, Any]:
@@ -76,63 +114,60 @@ def expand_range_to_cells(range_str: str, values: List[List[Any]]) -> Dict[str,
         >>> expand_range_to_cells("A1:B2", [["a1", "b1"], ["a2", "b2"]])
         {'A1': 'a1', 'B1': 'b1', 'A2': 'a2', 'B2': 'b2'}
     """
-    from sheet_client.utils import a1_to_grid_range, index_to_column
-
-    # Normalize single cell references (A1 -> A1:A1)
-    # Google Sheets API returns single cells without the colon
-    normalized_range = range_str
-    if '!' in range_str:
-        sheet_name, cell_part = range_str.split('!', 1)
-        if ':' not in cell_part:
-            normalized_range = f"{sheet_name}!{cell_part}:{cell_part}"
-    elif ':' not in range_str:
-        normalized_range = f"{range_str}:{range_str}"
-
-    # Parse the range
-    grid_range = a1_to_grid_range(normalized_range)
-
-    # Extract sheet name if present
-    sheet_prefix = ""
-    if '!' in range_str:
-        sheet_prefix = range_str.split('!')[0] + '!'
+    # One split: 'Sheet1!A1:B2' -> ('Sheet1!', 'A1:B2'). rpartition, since a
+    # quoted sheet name may itself contain '!'. _parse_a1 reads a bare
+    # 'A1' as A1:A1, which is how the API reports single cells; only the
+    # top-left corner is needed here.
+    sheet_name, sep, cell_part = range_str.rpartition('!')
+    sheet_prefix = sheet_name + sep
+    start_row, _, start_col, _ = _parse_a1(cell_part)
 
-    result = {}
-    start_row = grid_range.get('startRowIndex', 0)
-    start_col = grid_range.get('startColumnIndex', 0)
+    start_row = (start_row or 0) + 1  # 1-indexed
+    start_col = start_col or 0
 
-    for row_idx, row_values in enumerate(values):
-        for col_idx, value in enumerate(row_values):
-            actual_row = start_row + row_idx + 1  # 1-indexed
-            actual_col = start_col + col_idx
-            col_letter = index_to_column(actual_col)
-            cell_addr = f"{sheet_prefix}{col_letter}{actual_row}"
-            result[cell_addr] = value
+    # Column prefixes once per range, not once per cell.
+    ncols = max(map(len, values), default=0)
+    prefixes = [f"{sheet_prefix}{index_to_column(start_col + c)}" for c in range(ncols)]
 
-    return result
+    return {
+        f"{prefixes[col_idx]}{row_num}": value
+        for row_num, row_values in enumerate(values, start_row)
+        for col_idx, value in enumerate(row_values)
+    }
 
 
-def detect_format(text: str) -> str:
+_FIRST_NON_SPACE = re.compile(r'\S')
+_FIRST_NON_SPACE_BYTES = re.compile(rb'\S')
+
+
+def detect_format(text: Union[str, bytes]) -> str:
     """Auto-detect input format (JSON or space-delimited).
 
     Args:
-        text: Input text
+        text: Input text, as str or raw UTF-8 bytes
 
     Returns:
         'json' or 'cell_value'
     """
-    text = text.strip()
-
-    if text.startswith('{') or text.startswith('['):
-        return 'json'
+    # Look at the first non-whitespace character only; strip() would copy
+    # a multi-MB payload just to read one byte.
+    if isinstance(text, bytes):
+        m = _FIRST_NON_SPACE_BYTES.search(text)
+        is_json = m is not None and m.group() in (b'{', b'[')
+    else:
+        m = _FIRST_NON_SPACE.search(text)
+        is_json = m is not None and m.group() in ('{', '[')
 
-    return 'cell_value'
+    return 'json' if is_json else 'cell_value'
 
 
-def parse_input(text: str) -> Union[Dict[str, Any], Dict[str, List[List[Any]]]]:
+def parse_input(text: Union[str, bytes]) -> Union[Dict[str, Any], Dict[str, List[List[Any]]]]:
     """Parse input in either format, auto-detecting.
 
     Args:
-        text: Input text (JSON or space-delimited)
+        text: Input text (JSON or space-delimited), as str or raw UTF-8
+            bytes. JSON bytes go to the decoder as-is; only cell/value
+            text is decoded.
 
     Returns:
         Dict of cell/value pairs or range/values pairs
@@ -140,14 +175,15 @@ def parse_input(text: str) -> Union[Dict[str, Any], Dict[str, List[List[Any]]]]:
     format_type = detect_format(text)
 
     if format_type == 'json':
-        return json.loads(text)
-    else:
-        return parse_cell_value_pairs(text)
+        return _json_loads(text)
+    if isinstance(text, bytes):
+        text = text.decode('utf-8')
+    return parse_cell_value_pairs(text)
 
 
-def read_stdin() -> str:
-    """Read all input from stdin."""
+def read_stdin() -> bytes:
+    """Read all piped input from stdin as raw bytes (b"" for a terminal)."""
     if sys.stdin.isatty():
         # No piped input
-        return ""
-    return sys.stdin.read()
+        return b""
+    return sys.stdin.buffer.read()
@@ -28,6 +28,7 @@ from .grammar import (
     a1_range_for_locator,
     classify,
 )
+from .verbs import _resolve_sheet_id
 
 
 # ----------------------------- registry -----------------------------
@@ -86,9 +87,13 @@ def dispatch(verb: str, client: SheetsClient, target: Target, data: Any = None)
 # ----------------------------- helpers -----------------------------
 
 
+# meta_read() field masks — each lookup asks only for what it inspects.
+_PROTECTED_FIELDS = "sheets(properties(sheetId),protectedRanges)"
+
+
 def _sheet_props(client: SheetsClient, spreadsheet_id: str, title: str) -> Dict[str, Any]:
     """Return the sheet's properties dict (raising if not found)."""
-    meta = client.meta_read(spreadsheet_id)
+    meta = client.meta_read(spreadsheet_id, fields="sheets.properties")
     for sheet in meta.get("sheets", []):
         props = sheet.get("properties", {})
         if props.get("title") == title:
@@ -100,7 +105,7 @@ def _sheet_id(client: SheetsClient, target: Target) -> int:
     if target.sheet is None:
         raise GrammarError("sheet target required")
     assert target.spreadsheet_id is not None
-    return int(_sheet_props(client, target.spreadsheet_id, target.sheet)["sheetId"])
+    return _resolve_sheet_id(client, target.spreadsheet_id, target.sheet)
 
 
 def _grid_range(client: SheetsClient, target: Target) -> Dict[str, Any]:
@@ -259,7 +264,36 @@ def _format_get(client, target, _data):
     return [[c.get("userEnteredFormat", {}) for c in row] for row in cells]
 
 
+def _update_cells(client, target, grid: List[List[Any]], field: str) -> Any:
+    """Write one ``field`` per cell from a 2D list as a single updateCells.
+
+    Rows start at the target's top-left cell. Anchoring with ``start``
+    rather than ``range`` means cells the grid doesn't reach are untouched.
+    """
+    gr = _grid_range(client, target)
+    return client.meta_write(target.spreadsheet_id, [{
+        "updateCells": {
+            "start": {
+                "sheetId": gr["sheetId"],
+                "rowIndex": gr.get("startRowIndex", 0),
+                "columnIndex": gr.get("startColumnIndex", 0),
+            },
+            "rows": [{"values": [{field: v} for v in row]} for row in grid],
+            "fields": field,
+        }
+    }])
+
+
+def _is_grid(data: Any) -> bool:
+    return isinstance(data, list) and bool(data) and all(isinstance(row, list) for row in data)
+
+
 def _format_put(client, target, data):
+    # A 2D list (the shape `get .format` returns) sets each cell's format.
+    if _is_grid(data):
+        if not all(isinstance(c, dict) for row in data for c in row):
+            raise GrammarError("put .format grid cells must be JSON objects")
+        return _update_cells(client, target, data, "userEnteredFormat")
     if not isinstance(data, dict):
         raise GrammarError("put .format requires a JSON object of format fields")
     gr = _grid_range(client, target)
@@ -377,6 +411,10 @@ def _note_get(client, target, _data):
 
 
 def _note_put(client, target, data):
+    # A 2D list (the shape `get .note` returns) sets a note per cell.
+    if _is_grid(data):
+        notes = [[n if isinstance(n, str) else str(n) for n in row] for row in data]
+        return _update_cells(client, target, notes, "note")
     text = data if isinstance(data, str) else str(data)
     gr = _grid_range(client, target)
     return client.meta_write(target.spreadsheet_id, [{
@@ -435,7 +473,7 @@ def _protected_range_put(client, target, data):
 def _protected_range_get(client, target, _data):
     """List protected ranges whose GridRange overlaps the target."""
     assert target.spreadsheet_id is not None
-    meta = client.meta_read(target.spreadsheet_id)
+    meta = client.meta_read(target.spreadsheet_id, fields=_PROTECTED_FIELDS)
     gr = _grid_range(client, target)
     sid = gr["sheetId"]
     out = []
@@ -487,7 +525,7 @@ def _protected_sheet_list(client, target) -> List[Dict[str, Any]]:
     """Return whole-sheet protections on the target sheet."""
     assert target.spreadsheet_id is not None
     sid = _sheet_id(client, target)
-    meta = client.meta_read(target.spreadsheet_id)
+    meta = client.meta_read(target.spreadsheet_id, fields=_PROTECTED_FIELDS)
     for sheet in meta.get("sheets", []):
         if sheet.get("properties", {}).get("sheetId") != sid:
             continue
@@ -776,7 +814,8 @@ register(
 def _sheet_filter_get(client, target, _data):
     assert target.spreadsheet_id is not None
     sid = _sheet_id(client, target)
-    meta = client.meta_read(target.spreadsheet_id)
+    meta = client.meta_read(target.spreadsheet_id,
+                            fields="sheets(properties(sheetId),basicFilter)")
     for sheet in meta.get("sheets", []):
         if sheet.get("properties", {}).get("sheetId") == sid:
             return sheet.get("basicFilter")
@@ -814,7 +853,8 @@ register(
 
 def _conditional_rules(client, target) -> List[Dict[str, Any]]:
     assert target.spreadsheet_id is not None
-    meta = client.meta_read(target.spreadsheet_id)
+    meta = client.meta_read(target.spreadsheet_id,
+                            fields="sheets(properties(sheetId),conditionalFormats)")
     sid = _sheet_id(client, target)
     for sheet in meta.get("sheets", []):
         if sheet.get("properties", {}).get("sheetId") == sid:
@@ -1013,7 +1053,7 @@ register("autofit", TargetType.COLUMN, put=_autofit_put("COLUMNS"))
 
 
 def _spreadsheet_title_get(client, target, _data):
-    meta = client.meta_read(target.spreadsheet_id)
+    meta = client.meta_read(target.spreadsheet_id, fields="properties.title")
     return meta.get("properties", {}).get("title")
 
 
@@ -1036,7 +1076,8 @@ register("title", TargetType.SPREADSHEET, get=_spreadsheet_title_get, put=_sprea
 
 def _ss_prop_get(field: str) -> Handler:
     def _get(client, target, _data):
-        return client.meta_read(target.spreadsheet_id).get("properties", {}).get(field)
+        return client.meta_read(target.spreadsheet_id, fields=f"properties.{field}") \
+            .get("properties", {}).get(field)
     return _get
 
 
@@ -1106,7 +1147,7 @@ register(
 
 
 def _named_ranges(client, sid: str) -> List[Dict[str, Any]]:
-    return list(client.meta_read(sid).get("namedRanges", []) or [])
+    return list(client.meta_read(sid, fields="namedRanges").get("namedRanges", []) or [])
 
 
 def _find_named(client, sid: str, name: str) -> Optional[Dict[str, Any]]:
@@ -1155,11 +1196,10 @@ def _range_spec_to_grid(client, sid: str, spec: Any) -> Dict[str, Any]:
     a1 = spec[bang + 1:]
     if len(sheet_name) >= 2 and sheet_name.startswith("'") and sheet_name.endswith("'"):
         sheet_name = sheet_name[1:-1].replace("''", "'")
-    for sheet in client.meta_read(sid).get("sheets", []):
-        props = sheet.get("properties", {})
-        if props.get("title") == sheet_name:
-            return a1_to_grid_range(a1, sheet_id=int(props["sheetId"]))
-    raise GrammarError(f"sheet not found in named range spec: {sheet_name!r}")
+    sheet_id = client.sheet_id(sid, sheet_name)
+    if sheet_id is None:
+        raise GrammarError(f"sheet not found in named range spec: {sheet_name!r}")
+    return a1_to_grid_range(a1, sheet_id=sheet_id)
 
 
 def _named_put(client, target, data):
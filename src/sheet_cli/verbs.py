@@ -7,9 +7,11 @@ APIs when possible.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from sheet_client import CellData, SheetsClient
+from sheet_client.utils import column_to_index, index_to_column
 
 from .grammar import (
     GrammarError,
@@ -27,12 +29,10 @@ from .grammar import (
 
 def _resolve_sheet_id(client: SheetsClient, spreadsheet_id: str, sheet_title: str) -> int:
     """Resolve a sheet title to its numeric sheetId within a spreadsheet."""
-    meta = client.meta_read(spreadsheet_id)
-    for sheet in meta.get("sheets", []):
-        props = sheet.get("properties", {})
-        if props.get("title") == sheet_title:
-            return int(props.get("sheetId"))
-    raise GrammarError(f"sheet not found: {sheet_title!r}")
+    sheet_id = client.sheet_id(spreadsheet_id, sheet_title)
+    if sheet_id is None:
+        raise GrammarError(f"sheet not found: {sheet_title!r}")
+    return sheet_id
 
 
 def _locator_to_dimension_range(target: Target, sheet_id: int) -> Dict[str, Any]:
@@ -61,6 +61,69 @@ def _locator_to_dimension_range(target: Target, sheet_id: int) -> Dict[str, Any]
     raise GrammarError(f"expected ROW or COLUMN, got {tt.value}")
 
 
+def _as_grid(value: Any) -> List[List[Any]]:
+    """2D arrays pass through; any other value becomes a 1x1 grid."""
+    if isinstance(value, list) and value and isinstance(value[0], list):
+        return value
+    return [[value]]
+
+
+_CELL_RE = re.compile(r"^([A-Za-z]{1,3})([1-9][0-9]*)$")
+
+
+def _coalesce_cells(ops: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Fold single-cell writes into rectangular blocks, or None if not all cells.
+
+    Cells are grouped per sheet; each row's contiguous columns form a run,
+    and runs spanning the same columns on consecutive rows stack into one
+    block. Only fills cells that were given — gaps stay separate ranges.
+    """
+    # sheet prefix -> {row: {col: value}}, in first-seen sheet order
+    sheets: Dict[str, Dict[int, Dict[int, Any]]] = {}
+    for op in ops:
+        values = op["values"]
+        if len(values) != 1 or len(values[0]) != 1:
+            return None
+        value = values[0][0]
+        if isinstance(value, (list, dict)):
+            return None
+        prefix, sep, cell = op["range"].rpartition("!")
+        m = _CELL_RE.match(cell)
+        if m is None:
+            return None
+        row, col = int(m.group(2)) - 1, column_to_index(m.group(1))
+        sheets.setdefault(prefix + sep, {}).setdefault(row, {})[col] = value
+
+    out: List[Dict[str, Any]] = []
+    for prefix, rows in sheets.items():
+        # open blocks keyed by (first col, width): [first row, last row, values]
+        open_blocks: Dict[Tuple[int, int], List[Any]] = {}
+        blocks: List[Tuple[int, int, List[Any]]] = []
+        for row in sorted(rows):
+            cells = rows[row]
+            cols = sorted(cells)
+            start = 0
+            for i in range(1, len(cols) + 1):
+                if i < len(cols) and cols[i] == cols[i - 1] + 1:
+                    continue
+                c0, width = cols[start], i - start
+                run = [cells[c] for c in cols[start:i]]
+                block = open_blocks.get((c0, width))
+                if block is not None and block[1] == row - 1:
+                    block[1] = row
+                    block[2].append(run)
+                else:
+                    block = open_blocks[(c0, width)] = [row, row, [run]]
+                    blocks.append((c0, width, block))
+                start = i
+        for c0, width, (r0, r1, values) in blocks:
+            a1 = f"{index_to_column(c0)}{r0 + 1}"
+            if width > 1 or r1 > r0:
+                a1 += f":{index_to_column(c0 + width - 1)}{r1 + 1}"
+            out.append({"range": prefix + a1, "values": values})
+    return out
+
+
 # ------------------------------ get --------------------------------
 
 
@@ -119,18 +182,19 @@ def do_put(client: SheetsClient, target: Target, data: Any) -> Dict[str, Any]:
     write_ops: List[Dict[str, Any]] = []
 
     if isinstance(data, dict):
-        for key, value in data.items():
-            # key may be a locator relative to the target's sheet; if it already
-            # contains '!', pass through, otherwise qualify with the target sheet.
-            if "!" in key:
-                range_str = key
-            else:
-                sub = Target(target.spreadsheet_id, target.sheet, key)
-                range_str = a1_range_for_locator(sub)
-            if isinstance(value, list) and value and isinstance(value[0], list):
-                write_ops.append({"range": range_str, "values": value})
-            else:
-                write_ops.append({"range": range_str, "values": [[value]]})
+        # key may be a locator relative to the target's sheet; if it already
+        # contains '!', pass through, otherwise qualify with the target sheet.
+        # The (quoted) sheet prefix is the same for every key — build it once.
+        prefix = "" if target.sheet is None else a1_range_for_locator(
+            Target(target.spreadsheet_id, target.sheet, None)) + "!"
+        write_ops = [
+            {"range": key if "!" in key else prefix + key, "values": _as_grid(value)}
+            for key, value in data.items()
+        ]
+        # All single cells (the usual piped "A1 x" input): send contiguous
+        # cells as blocks rather than one range per cell. Mixed dicts keep
+        # their per-key ops so overlapping keys still apply in order.
+        write_ops = _coalesce_cells(write_ops) or write_ops
     elif isinstance(data, list):
         if tt not in (TargetType.RANGE, TargetType.ROW, TargetType.COLUMN, TargetType.SHEET):
             raise GrammarError("bare 2D array requires a range/row/column/sheet target")
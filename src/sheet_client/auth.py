@@ -1,15 +1,19 @@
 """OAuth 2.0 authentication for Google Sheets API."""
 
+from __future__ import annotations
+
 import os
 from pathlib import Path
-from typing import Optional
-
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.oauth2.credentials import Credentials
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from .exceptions import AuthenticationError
 
+# google.auth / google_auth_oauthlib are imported inside get_credentials, on
+# the path that needs them: a cached, still-valid token never loads the
+# refresh transport or the OAuth flow machinery.
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
 
 # Scopes required for Google Sheets and Drive API.
 # Drive is needed at the full `drive` level so `delete_spreadsheet()` can move
@@ -22,6 +26,11 @@ SCOPES = [
 
 DEFAULT_CREDS_DIR = Path.home() / '.sheet-cli'
 
+# Credentials already loaded in this process, keyed on (credentials_path,
+# token_path). A second SheetsClient reuses them instead of re-reading and
+# re-validating token.json; entries are only served while still valid.
+_loaded: Dict[Tuple[str, str], Credentials] = {}
+
 
 def _has_required_scopes(creds: Credentials) -> bool:
     scopes = getattr(creds, 'scopes', None)
@@ -35,6 +44,9 @@ def get_credentials(credentials_path: Optional[str] = None,
                    force_reauth: bool = False) -> Credentials:
     """Get OAuth 2.0 credentials, prompting user if needed.
 
+    Credentials are kept for the life of the process: later calls with the
+    same paths return the same object while it is still valid.
+
     Args:
         credentials_path: Path to OAuth client credentials JSON file
                          (defaults to ~/.sheet-cli/credentials.json)
@@ -53,6 +65,14 @@ def get_credentials(credentials_path: Optional[str] = None,
     if token_path is None:
         token_path = str(DEFAULT_CREDS_DIR / 'token.json')
 
+    key = (credentials_path, token_path)
+    if force_reauth:
+        _loaded.pop(key, None)
+    else:
+        cached = _loaded.get(key)
+        if cached is not None and cached.valid:
+            return cached
+
     DEFAULT_CREDS_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
 
     # Legacy pickle tokens from pre-JSON versions are always stale (pickle is
@@ -61,6 +81,8 @@ def get_credentials(credentials_path: Optional[str] = None,
     if legacy_pickle.exists():
         legacy_pickle.unlink()
 
+    from google.oauth2.credentials import Credentials
+
     creds: Optional[Credentials] = None
 
     if force_reauth and os.path.exists(token_path):
@@ -79,6 +101,7 @@ def get_credentials(credentials_path: Optional[str] = None,
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
+            from google.auth.transport.requests import Request
             try:
                 creds.refresh(Request())
             except Exception as e:
@@ -90,6 +113,7 @@ def get_credentials(credentials_path: Optional[str] = None,
                     "Please download OAuth 2.0 Client ID credentials from Google Cloud Console."
                 )
 
+            from google_auth_oauthlib.flow import InstalledAppFlow
             try:
                 flow = InstalledAppFlow.from_client_secrets_file(
                     credentials_path, SCOPES)
@@ -106,4 +130,5 @@ def get_credentials(credentials_path: Optional[str] = None,
             raise AuthenticationError(f"Failed to save token to {token_path}: {e}")
 
     assert creds is not None
+    _loaded[key] = creds
     return creds
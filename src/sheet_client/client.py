@@ -1,14 +1,61 @@
 """Main Google Sheets API client."""
 
+import datetime
+import email.utils
+import functools
+import io
+import json
+import random
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import IntFlag
-from typing import Any, Dict, List, Optional
-
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .auth import get_credentials
 from .exceptions import SheetsAPIError, RateLimitError, ServerError
+from .utils import _parse_a1
+
+# values.batchUpdate rejects payloads much past ~10 MB / 40k cells; write()
+# splits larger inputs into several calls of at most this many cells.
+_MAX_WRITE_CELLS = 30000
+
+# Concurrent spreadsheets.get calls for a grid read spanning several sheets.
+_GRID_READ_WORKERS = 4
+
+# spreadsheets.batchUpdate takes at most this many requests per call;
+# meta_write() sends longer lists as consecutive calls.
+_MAX_META_REQUESTS = 500
+
+# The discovery client already sends ``accept-encoding: gzip`` and tags the
+# user agent with "(gzip)", which Google needs before it compresses replies.
+_USER_AGENT = 'sheet-cli/0.1.0'
+
+# Ceiling on a single retry wait, in seconds (including server Retry-After).
+_MAX_BACKOFF = 32
+
+# Rate limiting (429) and transient server/gateway errors are retried;
+# every other status is raised on first sight.
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# How long sheet_id() trusts its title -> sheetId map, in seconds. Writes
+# through this client invalidate it at once; the TTL bounds staleness from
+# changes made elsewhere.
+_SHEET_IDS_TTL = 60.0
+
+# Metadata-cache key for sheet_id()'s map; can't collide with a fields mask.
+_SHEET_IDS = object()
+
+# read_async() sends a group's queued ranges as soon as this many are waiting.
+_MAX_PENDING_READS = 100
+
+# googleapiclient / httplib2 are imported where they are first used, not at
+# module load: `sheet-cli --help`, argument errors and daemon-forwarded
+# commands never construct a client and so never pay for them.
+
+
+# SheetsClient.get() instances, keyed by (credentials_path, token_path).
+_CLIENT_CACHE: Dict[Tuple[Optional[str], Optional[str]], 'SheetsClient'] = {}
 
 
 class CellData(IntFlag):
@@ -36,20 +83,126 @@ class SheetsClient:
     ``copy_sheet_to`` for spreadsheet-level operations.
     """
 
+    __slots__ = ('_credentials_path', '_token_path', '_authorized_http',
+                 '_service', '_spreadsheets', '_values_resource', '_drive',
+                 '_pending_reads', '_meta_ttl', '_meta_cache',
+                 '_grid_pool', '_worker_local', '__weakref__')
+
     def __init__(self, credentials_path: Optional[str] = None,
-                 token_path: Optional[str] = None):
+                 token_path: Optional[str] = None,
+                 meta_ttl: float = 0.0,
+                 meta_cache: Optional[Dict[str, Any]] = None):
         """Initialize the Sheets client with OAuth credentials.
 
+        Nothing is loaded here: credentials, the transport and each API
+        service are set up on first use (see ``connect()``), so a client
+        that never makes a call costs no token read or OAuth prompt.
+
         Args:
             credentials_path: Path to OAuth client credentials JSON
                              (defaults to ~/.sheet-cli/credentials.json)
             token_path: Path to cached token JSON file
                        (defaults to ~/.sheet-cli/token.json)
+            meta_ttl: Seconds to reuse a meta_read() response for the same
+                spreadsheet and field mask (default 0: always fetch).
+                Structure changes made through this client invalidate at
+                once; the TTL bounds staleness from edits made elsewhere.
+            meta_cache: Dict backing that cache, for sharing it between
+                clients (e.g. one per thread). Defaults to a private one.
         """
-        creds = get_credentials(credentials_path, token_path)
-        self.service = build('sheets', 'v4', credentials=creds)
-        self.spreadsheets = self.service.spreadsheets()
-        self.drive = build('drive', 'v3', credentials=creds)
+        self._credentials_path = credentials_path
+        self._token_path = token_path
+        self._authorized_http: Any = None
+        self._service: Any = None
+        self._spreadsheets: Any = None
+        self._values_resource: Any = None
+        self._drive: Any = None
+        # read_async() queue: (spreadsheet_id, valueRenderOption) -> [(range, future)]
+        self._pending_reads: Dict[Tuple[str, str], List[Tuple[str, Future]]] = {}
+        # Metadata cache: spreadsheet_id -> {fields: (monotonic stamp, meta)},
+        # plus sheet_id()'s {title: sheetId} map under the _SHEET_IDS key.
+        self._meta_ttl = meta_ttl
+        self._meta_cache: Dict[str, Any] = {} if meta_cache is None else meta_cache
+        # Multi-sheet grid reads: worker pool and per-worker transports,
+        # both created on first use.
+        self._grid_pool: Optional[ThreadPoolExecutor] = None
+        self._worker_local = threading.local()
+
+    def connect(self) -> None:
+        """Load credentials and build the Sheets service now, not on first call.
+
+        For long-lived callers that want any OAuth prompt or credential
+        error up front.
+        """
+        self._values  # builds the transport and the Sheets service with it
+
+    @property
+    def _http(self) -> Any:
+        """Authorized transport, shared by both services; built on first use."""
+        if self._authorized_http is None:
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.http import build_http, set_user_agent
+
+            creds = get_credentials(self._credentials_path, self._token_path)
+            # One authorized transport for both services. ``build(credentials=...)``
+            # would give each service its own httplib2.Http; sharing it keeps a
+            # single keep-alive connection pool for the life of the client.
+            self._authorized_http = AuthorizedHttp(
+                creds, http=set_user_agent(build_http(), _USER_AGENT))
+        return self._authorized_http
+
+    def _build(self, name: str, version: str) -> Any:
+        from googleapiclient.discovery import build
+
+        # Discovery documents come from the copies bundled with
+        # google-api-python-client: no fetch, and no on-disk cache to consult.
+        return build(name, version, http=self._http, model=_json_model(),
+                     static_discovery=True, cache_discovery=False)
+
+    @property
+    def service(self) -> Any:
+        """Sheets v4 service, built on first use."""
+        if self._service is None:
+            self._service = self._build('sheets', 'v4')
+        return self._service
+
+    @property
+    def spreadsheets(self) -> Any:
+        """The ``spreadsheets()`` resource, built on first use."""
+        if self._spreadsheets is None:
+            self._spreadsheets = self.service.spreadsheets()
+        return self._spreadsheets
+
+    @property
+    def _values(self) -> Any:
+        # values() builds a fresh Resource (and re-attaches every method) on
+        # each call; every read/write/clear goes through this one.
+        if self._values_resource is None:
+            self._values_resource = self.spreadsheets.values()
+        return self._values_resource
+
+    @property
+    def drive(self) -> Any:
+        """Drive v3 service, built on first use (listing, copy, delete)."""
+        if self._drive is None:
+            self._drive = self._build('drive', 'v3')
+        return self._drive
+
+    @classmethod
+    def get(cls, credentials_path: Optional[str] = None,
+            token_path: Optional[str] = None) -> 'SheetsClient':
+        """Return the process-wide client for these credentials.
+
+        Built on first call and reused afterwards, so a script making many
+        calls loads the token and opens the HTTPS connection once. httplib2
+        connections are not thread-safe: threads should each construct
+        their own ``SheetsClient`` instead.
+        """
+        key = (credentials_path, token_path)
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _CLIENT_CACHE[key] = cls(credentials_path, token_path)
+        return client
 
     def _execute_with_retry(self, request, max_retries: int = 3) -> Any:
         """Execute API request with exponential backoff for rate limits and server errors.
@@ -66,48 +219,51 @@ class SheetsClient:
             ServerError: If server error persists after retries
             SheetsAPIError: For other API errors
         """
-        for attempt in range(max_retries):
-            try:
-                return request.execute()
-            except HttpError as e:
-                status_code = e.resp.status
+        # Straight-line happy path; the retry loop only runs after a failure.
+        try:
+            return request.execute()
+        except Exception as e:
+            return self._retry_after_error(request, e, max_retries)
 
-                # Rate limit (429) - retry with backoff
+    def _retry_after_error(self, request, error: Exception, max_retries: int) -> Any:
+        """Retry loop for ``_execute_with_retry`` once the first attempt failed."""
+        from googleapiclient.errors import HttpError
+
+        attempt = 0
+        while True:
+            if not isinstance(error, HttpError):
+                raise error
+            status_code = error.resp.status
+
+            # Anything but a rate limit or transient server error is final.
+            if status_code not in _RETRY_STATUSES:
+                raise SheetsAPIError(
+                    f"API error {status_code}: {str(error)}",
+                    status_code=status_code,
+                    response=getattr(error, 'error_details', None)
+                )
+            if attempt >= max_retries - 1:
                 if status_code == 429:
-                    if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt)
-                        time.sleep(wait_time)
-                        continue
                     raise RateLimitError(
                         f"Rate limit exceeded after {max_retries} retries",
                         status_code=status_code,
-                        response=e.error_details if hasattr(e, 'error_details') else None
-                    )
-
-                # Server errors (500, 503) - retry with backoff
-                elif status_code in (500, 503):
-                    if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt)
-                        time.sleep(wait_time)
-                        continue
-                    raise ServerError(
-                        f"Server error {status_code} after {max_retries} retries",
-                        status_code=status_code,
-                        response=e.error_details if hasattr(e, 'error_details') else None
+                        response=getattr(error, 'error_details', None)
                     )
-
-                # Other errors - raise immediately
-                else:
-                    raise SheetsAPIError(
-                        f"API error {status_code}: {str(e)}",
-                        status_code=status_code,
-                        response=e.error_details if hasattr(e, 'error_details') else None
-                    )
-
-        raise SheetsAPIError("Unexpected error in retry logic")
+                raise ServerError(
+                    f"Server error {status_code} after {max_retries} retries",
+                    status_code=status_code,
+                    response=getattr(error, 'error_details', None)
+                )
+            time.sleep(_backoff_delay(attempt, error))
+
+            attempt += 1
+            try:
+                return request.execute()
+            except Exception as e:
+                error = e
 
     def read(self, spreadsheet_id: str, ranges: List[str],
-             types: int = CellData.VALUE) -> dict:
+             types: int = CellData.VALUE, dedupe: bool = True) -> dict:
         """Read cells from specified ranges.
 
         Args:
@@ -128,6 +284,10 @@ class SheetsClient:
                     CellData.VALUE | CellData.FORMULA
                     CellData.VALUE | CellData.FORMULA | CellData.FORMAT
 
+            dedupe: Fetch a range repeated in ``ranges`` once (default True).
+                valueRanges still has one entry per requested range, in
+                order; repeats share the same dict. Value reads only.
+
         Returns:
             Raw API response dict with requested cell data.
 
@@ -147,7 +307,13 @@ class SheetsClient:
                 ]
             }
 
-            With FORMAT or NOTE, includes additional cell properties.
+            With FORMAT or NOTE, the response is the spreadsheets.get grid
+            payload, trimmed to each sheet's sheetId/title and the CellData
+            fields asked for: formattedValue/effectiveValue (VALUE),
+            userEnteredValue (FORMULA), userEnteredFormat (FORMAT), note (NOTE).
+            FORMAT also returns merges and row/column metadata. Ranges on
+            different sheets are fetched concurrently and merged, with
+            sheets in first-requested order.
 
         Examples:
             # Read values only (fastest)
@@ -173,35 +339,224 @@ class SheetsClient:
                 ['Sheet1!A1:C10', 'Sheet2!B2:D5', 'Summary!A1']
             )
         """
-        # FORMAT or NOTE require the heavier spreadsheets.get endpoint.
-        need_grid_data = bool(types & (CellData.FORMAT | CellData.NOTE))
+        types = int(types)  # plain-int masks below; IntFlag ops are Python-level
+        if types & ~_ALL_TYPES:
+            raise ValueError(f"invalid CellData flags: {types:#b}")
+        if not ranges:
+            return {'spreadsheetId': spreadsheet_id, 'valueRanges': []}
 
-        if need_grid_data:
-            request = self.spreadsheets.get(
-                spreadsheetId=spreadsheet_id,
-                includeGridData=True,
-                ranges=ranges
-            )
-            return self._execute_with_retry(request)
+        # FORMAT or NOTE require the heavier spreadsheets.get endpoint.
+        if types & _GRID_TYPES:
+            return self._grid_read(spreadsheet_id, ranges, _grid_fields(types))
 
-        value_render = 'FORMULA' if (types & CellData.FORMULA) else 'FORMATTED_VALUE'
+        value_render = _RENDER[bool(types & _FORMULA)]
 
         if len(ranges) == 1:
-            request = self.spreadsheets.values().get(
+            request = self._values.get(
                 spreadsheetId=spreadsheet_id,
                 range=ranges[0],
                 valueRenderOption=value_render
             )
         else:
-            request = self.spreadsheets.values().batchGet(
+            unique = list(dict.fromkeys(ranges)) if dedupe else ranges
+            request = self._values.batchGet(
                 spreadsheetId=spreadsheet_id,
-                ranges=ranges,
+                ranges=unique,
                 valueRenderOption=value_render
             )
+            if len(unique) < len(ranges):
+                response = self._execute_with_retry(request)
+                by_range = dict(zip(unique, response.get('valueRanges', [])))
+                response['valueRanges'] = [by_range.get(r, {'range': r}) for r in ranges]
+                return response
 
         return self._execute_with_retry(request)
 
-    def write(self, spreadsheet_id: str, data: List[dict]) -> dict:
+    def _grid_read(self, spreadsheet_id: str, ranges: List[str], fields: str) -> dict:
+        """spreadsheets.get with grid data; one call per sheet, run in parallel.
+
+        Ranges on different sheets are independent, so each sheet's ranges
+        go out as their own request on a small worker pool and the ``sheets``
+        lists are merged (in first-requested order). Workers use their own
+        transport: httplib2 connections are not thread-safe.
+        """
+        by_sheet: Dict[str, List[str]] = {}
+        for range_ in ranges:
+            by_sheet.setdefault(range_.rpartition('!')[0], []).append(range_)
+        if len(by_sheet) == 1:
+            return self._execute_with_retry(self.spreadsheets.get(
+                spreadsheetId=spreadsheet_id, includeGridData=True,
+                ranges=ranges, fields=fields))
+
+        if self._grid_pool is None:
+            self._grid_pool = ThreadPoolExecutor(
+                max_workers=_GRID_READ_WORKERS, thread_name_prefix='sheets-grid')
+
+        def fetch(sheet_ranges: List[str]) -> dict:
+            request = self.spreadsheets.get(
+                spreadsheetId=spreadsheet_id, includeGridData=True,
+                ranges=sheet_ranges, fields=fields)
+            request.http = self._worker_http()
+            return self._execute_with_retry(request)
+
+        parts = list(self._grid_pool.map(fetch, by_sheet.values()))
+        result = parts[0]
+        sheets = result.setdefault('sheets', [])
+        # An unqualified range and its sheet's title land in separate
+        # groups but the same sheet: fold those together.
+        by_id = {sheet['properties']['sheetId']: sheet for sheet in sheets}
+        for part in parts[1:]:
+            for sheet in part.get('sheets', []):
+                seen = by_id.get(sheet['properties']['sheetId'])
+                if seen is None:
+                    by_id[sheet['properties']['sheetId']] = sheet
+                    sheets.append(sheet)
+                    continue
+                seen.setdefault('data', []).extend(sheet.get('data', []))
+        return result
+
+    def _worker_http(self) -> Any:
+        """This thread's own authorized transport, sharing the credentials."""
+        http = getattr(self._worker_local, 'http', None)
+        if http is None:
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.http import build_http, set_user_agent
+            http = self._worker_local.http = AuthorizedHttp(
+                self._http.credentials,
+                http=set_user_agent(build_http(), _USER_AGENT))
+        return http
+
+    def read_stream(self, spreadsheet_id: str, range_: str,
+                    types: int = CellData.VALUE) -> Iterator[Any]:
+        """Yield the rows of one range without building the whole response.
+
+        For large exports. The body is fetched in one request as usual but
+        handed over as raw bytes; with the optional ``ijson`` package
+        (``pip install google-sheets-cli[streaming]``) rows are decoded one
+        at a time, so only the current row is ever a Python object. Without
+        it the body is decoded in full and rows are yielded from that.
+
+        Args:
+            spreadsheet_id: Spreadsheet ID (required)
+            range_: One A1 notation range
+            types: CellData flags, as for read()
+
+        Yields:
+            VALUE/FORMULA reads: each row as a list of values.
+            With FORMAT or NOTE: each RowData dict ({'values': [CellData,
+            ...]}) from the grid payload, masked like read(). Sheet-level
+            parts of that payload (merges, row/column metadata) are skipped.
+
+        Examples:
+            for row in client.read_stream(sid, 'Log!A:F'):
+                writer.writerow(row)
+        """
+        types = int(types)  # plain-int masks below; IntFlag ops are Python-level
+        if types & ~_ALL_TYPES:
+            raise ValueError(f"invalid CellData flags: {types:#b}")
+        if types & _GRID_TYPES:
+            request = self.spreadsheets.get(
+                spreadsheetId=spreadsheet_id,
+                includeGridData=True,
+                ranges=[range_],
+                fields=_grid_fields(types)
+            )
+            prefix = 'sheets.item.data.item.rowData.item'
+        else:
+            request = self._values.get(
+                spreadsheetId=spreadsheet_id,
+                range=range_,
+                valueRenderOption=_RENDER[bool(types & _FORMULA)]
+            )
+            prefix = 'values.item'
+        # Keep the body as bytes: execute() still raises HttpError on error
+        # statuses before postproc runs, so retries work unchanged.
+        request.postproc = lambda _resp, content: content
+        body = self._execute_with_retry(request)
+
+        try:
+            import ijson
+        except ImportError:  # optional; decode the whole body instead
+            decoded = json.loads(body)
+            if types & _GRID_TYPES:
+                for sheet in decoded.get('sheets', []):
+                    for grid in sheet.get('data', []):
+                        yield from grid.get('rowData', [])
+            else:
+                yield from decoded.get('values', [])
+            return
+        yield from ijson.items(io.BytesIO(body), prefix, use_float=True)
+
+    def read_async(self, spreadsheet_id: str, range_: str,
+                   types: int = CellData.VALUE) -> Future:
+        """Queue a single-range value read; it is sent batched with its peers.
+
+        Reads queued for the same spreadsheet and render option go out as one
+        ``values.batchGet`` when any of their futures' ``result()`` is first
+        asked for, when ``flush_reads()`` is called, or once
+        ``_MAX_PENDING_READS`` are waiting. Nothing runs in the background:
+        httplib2 connections are not thread-safe, so the batch is sent on the
+        thread that needs it.
+
+        Args:
+            spreadsheet_id: Spreadsheet ID (required)
+            range_: One A1 notation range
+            types: CellData.VALUE and/or CellData.FORMULA; FORMAT and NOTE
+                need spreadsheets.get and are not batched here
+
+        Returns:
+            Future resolving to the range's ValueRange
+            ({'range': ..., 'values': [...]}).
+
+        Examples:
+            totals = client.read_async(sid, 'Summary!B2')
+            names = client.read_async(sid, 'People!A2:A')
+            print(totals.result(), names.result())  # one batchGet
+        """
+        types = int(types)  # plain-int masks below; IntFlag ops are Python-level
+        if types & ~_ALL_TYPES:
+            raise ValueError(f"invalid CellData flags: {types:#b}")
+        if types & _GRID_TYPES:
+            raise ValueError("read_async supports VALUE/FORMULA reads only")
+        value_render = _RENDER[bool(types & _FORMULA)]
+        key = (spreadsheet_id, value_render)
+
+        future = _PendingRead(self)
+        pending = self._pending_reads.setdefault(key, [])
+        pending.append((range_, future))
+        if len(pending) >= _MAX_PENDING_READS:
+            self._flush_group(key)
+        return future
+
+    def flush_reads(self) -> None:
+        """Send every read queued by ``read_async()``, one batchGet per group."""
+        for key in list(self._pending_reads):
+            self._flush_group(key)
+
+    def _flush_group(self, key: Tuple[str, str]) -> None:
+        pending = self._pending_reads.pop(key, None)
+        if not pending:
+            return
+        spreadsheet_id, value_render = key
+        request = self._values.batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=[range_ for range_, _ in pending],
+            valueRenderOption=value_render
+        )
+        try:
+            response = self._execute_with_retry(request)
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        # valueRanges come back in request order.
+        value_ranges = response.get('valueRanges', [])
+        for i, (range_, future) in enumerate(pending):
+            future.set_result(value_ranges[i] if i < len(value_ranges)
+                              else {'range': range_})
+
+    def write(self, spreadsheet_id: str, data: List[dict],
+              value_input_option: str = 'USER_ENTERED') -> dict:
         """Write cell values in a single batched call.
 
         Args:
@@ -214,6 +569,17 @@ class SheetsClient:
                     {'range': 'Sheet2!B5', 'values': [['text', '=SUM(A:A)']]},
                 ]
 
+                An entry may also carry 'format' (a CellFormat dict) and/or
+                'note' (a string), either one for every cell of its 'values'
+                block or as a 2D list matching it. Such writes need sheet-
+                qualified ranges; see Notes.
+
+            value_input_option: 'USER_ENTERED' (default) has the server parse
+                each cell as if typed in: formulas, dates, numbers in strings.
+                'RAW' stores values as given and skips that work, which
+                speeds up large pre-typed (e.g. numeric) writes; a string
+                like '=SUM(A1:A2)' is then kept as literal text.
+
         Returns:
             Raw API response with update results:
             {
@@ -225,9 +591,17 @@ class SheetsClient:
             }
 
         Notes:
-            - Uses valueInputOption=USER_ENTERED (formulas and dates are parsed).
-            - To clear values, use clear(). To write formatting or notes, use
-              meta_write() with repeatCell / updateCells requests.
+            - valueInputOption defaults to USER_ENTERED (formulas and dates
+              are parsed); see value_input_option.
+            - If any entry has 'format' or 'note', the whole call becomes one
+              spreadsheets.batchUpdate of updateCells requests, so values,
+              formats and notes land in a single round trip. Values are then
+              stored as typed: numbers and booleans as such, strings starting
+              with '=' as formulas (unless 'RAW'), other strings verbatim (no
+              date parsing), and the meta_write() response is returned.
+            - To clear values, use clear().
+            - Inputs over 30,000 cells are sent as several batchUpdate calls
+              (whole ranges per call); totals and responses are merged.
 
         Examples:
             # Write values
@@ -249,17 +623,88 @@ class SheetsClient:
                 {'range': 'Sheet3!C10', 'values': [[7, 8, 9]]}
             ])
         """
-        value_data = [{'range': d['range'], 'values': d['values']} for d in data]
+        if any(entry.keys() & _CELL_EXTRA_KEYS for entry in data):
+            return self.meta_write(spreadsheet_id, [
+                self._update_cells_request(spreadsheet_id, entry,
+                                           formulas=value_input_option != 'RAW')
+                for entry in data
+            ])
+
+        groups = _split_write_groups(data)
+        if len(groups) == 1:
+            return self._write_group(spreadsheet_id, groups[0], value_input_option)
+
+        result = {
+            'spreadsheetId': spreadsheet_id,
+            'totalUpdatedRows': 0,
+            'totalUpdatedColumns': 0,
+            'totalUpdatedCells': 0,
+            'totalUpdatedSheets': 0,
+            'responses': [],
+        }
+        for group in groups:
+            part = self._write_group(spreadsheet_id, group, value_input_option)
+            for key in ('totalUpdatedRows', 'totalUpdatedColumns',
+                        'totalUpdatedCells', 'totalUpdatedSheets'):
+                result[key] += part.get(key, 0)
+            result['responses'].extend(part.get('responses', []))
+        return result
+
+    def _write_group(self, spreadsheet_id: str, value_data: List[dict],
+                     value_input_option: str = 'USER_ENTERED') -> dict:
+        """Send one values.batchUpdate call for ``value_data``."""
         body = {
-            'valueInputOption': 'USER_ENTERED',
+            'valueInputOption': value_input_option,
             'data': value_data,
         }
-        request = self.spreadsheets.values().batchUpdate(
+        request = self._values.batchUpdate(
             spreadsheetId=spreadsheet_id,
             body=body,
         )
         return self._execute_with_retry(request)
 
+    def _update_cells_request(self, spreadsheet_id: str, entry: dict,
+                              formulas: bool = True) -> dict:
+        """Turn one write() entry into an updateCells request."""
+        title, _, a1 = entry['range'].rpartition('!')
+        if title[:1] == "'" and title[-1:] == "'":
+            title = title[1:-1].replace("''", "'")
+        sheet_id = self.sheet_id(spreadsheet_id, title) if title else None
+        if sheet_id is None:
+            raise ValueError(
+                f"format/note writes need a range on an existing sheet: {entry['range']!r}")
+        start_row, _, start_col, _ = _parse_a1(a1)
+
+        fields = ['userEnteredValue']
+        layers = [('userEnteredValue', [[_extended_value(v, formulas) for v in row]
+                                        for row in entry['values']])]
+        for key, field in (('format', 'userEnteredFormat'), ('note', 'note')):
+            if key in entry:
+                fields.append(field)
+                layers.append((field, entry[key]))
+
+        rows = []
+        for r, row in enumerate(entry['values']):
+            cells = []
+            for c in range(len(row)):
+                cell = {}
+                for field, layer in layers:
+                    value = layer[r][c] if isinstance(layer, list) else layer
+                    if value is not None:
+                        cell[field] = value
+                cells.append(cell)
+            rows.append({'values': cells})
+
+        return {'updateCells': {
+            'start': {
+                'sheetId': sheet_id,
+                'rowIndex': start_row or 0,
+                'columnIndex': start_col or 0,
+            },
+            'rows': rows,
+            'fields': ','.join(fields),
+        }}
+
     def clear(self, spreadsheet_id: str, ranges: List[str]) -> dict:
         """Clear cell values in one or more ranges.
 
@@ -278,19 +723,23 @@ class SheetsClient:
                 'clearedRanges': ['Sheet1!A1:B10', ...]
             }
         """
-        request = self.spreadsheets.values().batchClear(
+        request = self._values.batchClear(
             spreadsheetId=spreadsheet_id,
             body={'ranges': ranges},
         )
         return self._execute_with_retry(request)
 
-    def meta_read(self, spreadsheet_id: str) -> dict:
+    def meta_read(self, spreadsheet_id: str, fields: Optional[str] = None) -> dict:
         """Read spreadsheet metadata and structure.
 
         Read-only view of spreadsheet structure without cell data.
 
         Args:
             spreadsheet_id: Spreadsheet ID (required)
+            fields: Optional response field mask, e.g.
+                'sheets.properties(sheetId,title)'. The API returns only the
+                named fields — much smaller than the full metadata when a
+                caller just needs sheet IDs. Default: everything.
 
         Returns:
             Raw API response dict with:
@@ -339,12 +788,65 @@ class SheetsClient:
             meta = client.meta_read('spreadsheet-id')
             for nr in meta.get('namedRanges', []):
                 print(f"{nr['name']}: {nr['range']}")
+
+            # Only sheet titles and IDs
+            meta = client.meta_read('spreadsheet-id',
+                                    fields='sheets.properties(sheetId,title)')
         """
+        if self._meta_ttl > 0:
+            now = time.monotonic()
+            hit = self._meta_cache.get(spreadsheet_id, {}).get(fields)
+            if hit is not None and now - hit[0] < self._meta_ttl:
+                return hit[1]
+
+        kwargs: Dict[str, Any] = {'fields': fields} if fields else {}
         request = self.spreadsheets.get(
             spreadsheetId=spreadsheet_id,
-            includeGridData=False
+            includeGridData=False,
+            **kwargs
         )
-        return self._execute_with_retry(request)
+        meta = self._execute_with_retry(request)
+        if self._meta_ttl > 0:
+            self._meta_cache.setdefault(spreadsheet_id, {})[fields] = (now, meta)
+        return meta
+
+    def invalidate_metadata(self, spreadsheet_id: Optional[str] = None) -> None:
+        """Forget cached metadata and sheet IDs for one spreadsheet (or all).
+
+        Writes through this client do this automatically; call it after
+        changing structure some other way.
+        """
+        if spreadsheet_id is None:
+            self._meta_cache.clear()
+        else:
+            self._meta_cache.pop(spreadsheet_id, None)
+
+    def sheet_id(self, spreadsheet_id: str, title: str) -> Optional[int]:
+        """Numeric sheetId for a sheet title, or None if there is no such sheet.
+
+        Titles are looked up in a per-spreadsheet map fetched with a
+        ``sheets.properties(sheetId,title)`` mask and kept for
+        ``_SHEET_IDS_TTL`` seconds, so a run of structural edits resolves
+        each title once. ``meta_write``, ``copy_sheet_to``,
+        ``delete_spreadsheet`` and ``invalidate_metadata`` drop the map; an
+        unknown title refetches it once in case the sheet was added
+        elsewhere.
+
+        Examples:
+            sid = client.sheet_id('spreadsheet-id', 'Sales')
+        """
+        hit = self._meta_cache.get(spreadsheet_id, {}).get(_SHEET_IDS)
+        if hit is not None and time.monotonic() - hit[0] < _SHEET_IDS_TTL:
+            found = hit[1].get(title)
+            if found is not None:
+                return found
+        meta = self.meta_read(spreadsheet_id, fields='sheets.properties(sheetId,title)')
+        ids = {}
+        for sheet in meta.get('sheets', []):
+            props = sheet.get('properties', {})
+            ids[props.get('title')] = int(props.get('sheetId', 0))
+        self._meta_cache.setdefault(spreadsheet_id, {})[_SHEET_IDS] = (time.monotonic(), ids)
+        return ids.get(title)
 
     def meta_write(self, spreadsheet_id: str, requests: List[dict]) -> dict:
         """Write/modify spreadsheet metadata and structure.
@@ -354,7 +856,9 @@ class SheetsClient:
 
         Args:
             spreadsheet_id: Spreadsheet ID (required)
-            requests: List of request dicts (max 500 per call)
+            requests: List of request dicts. More than 500 are sent as
+                      consecutive calls of 500 (each call is atomic on its
+                      own, the whole list is not); replies are merged.
 
         Returns:
             {
@@ -456,10 +960,27 @@ class SheetsClient:
                 {'autoResizeDimensions': {...}}
             ])
         """
-        body = {'requests': requests}
+        # Any of these requests may change structure. Drop cached metadata
+        # before and after: a concurrent reader sharing the cache may
+        # re-cache the old structure while the write is in flight.
+        self.invalidate_metadata(spreadsheet_id)
+        try:
+            if len(requests) <= _MAX_META_REQUESTS:
+                return self._meta_write_chunk(spreadsheet_id, requests)
+            result = {'spreadsheetId': spreadsheet_id, 'replies': []}
+            for i in range(0, len(requests), _MAX_META_REQUESTS):
+                part = self._meta_write_chunk(
+                    spreadsheet_id, requests[i:i + _MAX_META_REQUESTS])
+                result['replies'].extend(part.get('replies', []))
+            return result
+        finally:
+            self.invalidate_metadata(spreadsheet_id)
+
+    def _meta_write_chunk(self, spreadsheet_id: str, requests: List[dict]) -> dict:
+        """Send one spreadsheets.batchUpdate call."""
         request = self.spreadsheets.batchUpdate(
             spreadsheetId=spreadsheet_id,
-            body=body
+            body={'requests': requests}
         )
         return self._execute_with_retry(request)
 
@@ -622,7 +1143,10 @@ class SheetsClient:
             sheetId=source_sheet_id,
             body={'destinationSpreadsheetId': destination_spreadsheet_id},
         )
-        return self._execute_with_retry(request)
+        try:
+            return self._execute_with_retry(request)
+        finally:
+            self.invalidate_metadata(destination_spreadsheet_id)
 
     def delete_spreadsheet(self, spreadsheet_id: str) -> None:
         """Delete a spreadsheet via the Drive API (moves it to trash).
@@ -631,7 +1155,10 @@ class SheetsClient:
             spreadsheet_id: Spreadsheet ID to delete
         """
         request = self.drive.files().delete(fileId=spreadsheet_id)
-        self._execute_with_retry(request)
+        try:
+            self._execute_with_retry(request)
+        finally:
+            self.invalidate_metadata(spreadsheet_id)
 
     def copy_spreadsheet(self, source_spreadsheet_id: str,
                          new_title: Optional[str] = None,
@@ -705,3 +1232,168 @@ class SheetsClient:
             kwargs['removeParents'] = ','.join(remove)
         request = self.drive.files().update(body={}, **kwargs)
         return self._execute_with_retry(request)
+
+
+# Every defined CellData bit, as a plain int; anything outside it is invalid.
+_ALL_TYPES = int(CellData.VALUE | CellData.FORMULA | CellData.FORMAT | CellData.NOTE)
+
+# Types that need spreadsheets.get grid data rather than the values endpoints.
+_GRID_TYPES = int(CellData.FORMAT | CellData.NOTE)
+
+# Single flags as plain ints, for the per-call tests in read() & co.
+_FORMULA = int(CellData.FORMULA)
+_FORMAT = int(CellData.FORMAT)
+
+# valueRenderOption, indexed by bool(types & _FORMULA).
+_RENDER = {True: 'FORMULA', False: 'FORMATTED_VALUE'}
+
+# CellData flag -> CellData fields it needs from a grid-data read.
+_GRID_CELL_FIELDS = (
+    (int(CellData.VALUE), 'formattedValue,effectiveValue'),
+    (int(CellData.FORMULA), 'userEnteredValue'),
+    (int(CellData.FORMAT), 'userEnteredFormat'),
+    (int(CellData.NOTE), 'note'),
+)
+
+
+def _grid_fields(types: int) -> str:
+    """spreadsheets.get field mask for a grid-data read of ``types``.
+
+    Without it the API returns every cell attribute (effectiveFormat alone
+    repeats the full default format per cell) plus all sheet metadata.
+    FORMAT also keeps the sheet's merges and the row/column metadata
+    (pixel sizes, hidden flags), which are only returned with grid data.
+    """
+    cell = ','.join(f for flag, f in _GRID_CELL_FIELDS if types & flag)
+    if types & _FORMAT:
+        return ('spreadsheetId,sheets(properties(sheetId,title),merges,'
+                'data(startRow,startColumn,rowMetadata,columnMetadata,'
+                f'rowData(values({cell}))))')
+    return ('spreadsheetId,sheets(properties(sheetId,title),'
+            f'data(startRow,startColumn,rowData(values({cell}))))')
+
+
+def _backoff_delay(attempt: int, error: Any) -> float:
+    """Seconds to wait before retry ``attempt + 1``.
+
+    The server's Retry-After (delay-seconds or HTTP-date) wins when present;
+    otherwise full jitter over ``[0, 2**attempt]`` so concurrent clients
+    don't retry in lockstep. Both are capped at ``_MAX_BACKOFF``.
+    """
+    retry_after = _retry_after_seconds(getattr(error, 'resp', None))
+    if retry_after is not None:
+        return min(retry_after, _MAX_BACKOFF)
+    return random.uniform(0, min(2 ** attempt, _MAX_BACKOFF))
+
+
+def _retry_after_seconds(resp: Any) -> Optional[float]:
+    """Parse a response's Retry-After header; None if absent or unusable."""
+    header = resp.get('retry-after') if isinstance(resp, dict) else None
+    if not header:
+        return None
+    try:
+        seconds = float(header)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(header)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        seconds = (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+    return max(seconds, 0.0)
+
+
+@functools.lru_cache(maxsize=None)
+def _json_model() -> Any:
+    """Request/response model backed by orjson, or None without it.
+
+    None lets ``build()`` use its stock stdlib-json JsonModel. The orjson
+    model only swaps the codec; anything orjson refuses to encode (or a
+    body that isn't JSON) goes through the stock code path.
+    """
+    try:
+        import orjson
+    except ImportError:  # optional speedup; stdlib json is the fallback
+        return None
+    from googleapiclient.model import JsonModel
+
+    class _OrjsonModel(JsonModel):
+        def serialize(self, body_value):
+            try:
+                return orjson.dumps(body_value)
+            except TypeError:
+                return super().serialize(body_value)
+
+        def deserialize(self, content):
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return super().deserialize(content)
+
+    # Neither Sheets nor Drive v3 uses the "dataWrapper" feature.
+    return _OrjsonModel(data_wrapper=False)
+
+
+_VALUE_RANGE_KEYS = frozenset(('range', 'values'))
+
+# write() entry keys the values API can't carry; any of them routes the
+# call through updateCells instead.
+_CELL_EXTRA_KEYS = frozenset(('format', 'note'))
+
+
+def _extended_value(value: Any, formulas: bool = True) -> Optional[dict]:
+    """ExtendedValue for one write() cell; None leaves the cell empty."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, (int, float)):
+        return {'numberValue': value}
+    value = str(value)
+    if formulas and value.startswith('='):
+        return {'formulaValue': value}
+    return {'stringValue': value}
+
+
+def _split_write_groups(value_data: List[dict],
+                        max_cells: int = _MAX_WRITE_CELLS) -> List[List[dict]]:
+    """Group ``value_data`` entries so each group holds at most ``max_cells``.
+
+    Entries are kept whole and in order; a single entry larger than the
+    limit gets a group of its own. Entries carrying keys beyond 'range' and
+    'values' are copied down to those two in the same pass that counts
+    their cells; plain ones (the usual case) are sent as given.
+    """
+    groups: List[List[dict]] = []
+    current: List[dict] = []
+    cells = 0
+    for entry in value_data:
+        size = sum(len(row) for row in entry['values'])
+        if current and cells + size > max_cells:
+            groups.append(current)
+            current, cells = [], 0
+        if entry.keys() > _VALUE_RANGE_KEYS:
+            entry = {'range': entry['range'], 'values': entry['values']}
+        current.append(entry)
+        cells += size
+    groups.append(current)
+    return groups
+
+
+class _PendingRead(Future):
+    """Future for a ``read_async()`` range; waiting on it sends its batch."""
+
+    def __init__(self, client: SheetsClient):
+        super().__init__()
+        self._client = client
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        if not self.done():
+            self._client.flush_reads()
+        return super().result(timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        if not self.done():
+            self._client.flush_reads()
+        return super().exception(timeout)
@@ -29,5 +29,5 @@ class RateLimitError(SheetsAPIError):
 
 
 class ServerError(SheetsAPIError):
-    """Raised when API returns server error (500, 503)."""
+    """Raised when API returns server error (500, 502, 503, 504)."""
     pass
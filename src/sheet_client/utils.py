@@ -1,7 +1,7 @@
 """Utility functions for A1 notation and grid range conversion."""
 
-import re
-from typing import Dict, Optional
+import functools
+from typing import Dict, Optional, Tuple
 
 
 def column_to_index(column: str) -> int:
@@ -21,15 +21,28 @@ def column_to_index(column: str) -> int:
         >>> column_to_index('AA')
         26
     """
+    column = column.upper()
+    index = _COL_TO_IDX.get(column)
+    if index is not None:
+        return index
+    return _column_to_index(column)
+
+
+@functools.lru_cache(maxsize=4096)
+def _column_to_index(column: str) -> int:
+    # Keyed on the upper-cased letters so 'aaa' and 'AAA' share an entry.
+    # Iterating bytes yields ints directly: no ord() call per letter.
     result = 0
-    for char in column.upper():
-        result = result * 26 + (ord(char) - ord('A') + 1)
+    for code in column.encode('ascii'):
+        result = result * 26 + (code - 64)  # 'A' (65) -> 1
     return result - 1
 
 
 def index_to_column(index: int) -> str:
     """Convert zero-based index to column letter(s).
 
+    Columns A–ZZ come from a table built at import; wider ones are computed.
+
     Args:
         index: Zero-based column index
 
@@ -44,6 +57,12 @@ def index_to_column(index: int) -> str:
         >>> index_to_column(26)
         'AA'
     """
+    if 0 <= index < len(_IDX_TO_COL):
+        return _IDX_TO_COL[index]
+    return _index_to_column(index)
+
+
+def _index_to_column(index: int) -> str:
     result = ""
     index += 1  # Convert to 1-based
     while index > 0:
@@ -53,32 +72,73 @@ def index_to_column(index: int) -> str:
     return result
 
 
-# Column letters capped at 3 chars (Sheets max is "ZZZ" ≈ column 18278, well
-# above the 10,000-column sheet limit). Keeping the cap tight also means
-# obvious garbage like "InvalidNotation" still fails parsing.
-_A1_CELL_RE = re.compile(r'^([A-Z]{1,3})(\d+)$')
-_A1_COL_RE  = re.compile(r'^([A-Z]{1,3})$')
-_A1_ROW_RE  = re.compile(r'^(\d+)$')
+# A–ZZ (702 columns) covers nearly every real sheet; lookups beat the loops.
+_IDX_TO_COL = tuple(_index_to_column(i) for i in range(26 + 26 * 26))
+_COL_TO_IDX = {col: i for i, col in enumerate(_IDX_TO_COL)}
+
 
+_DIGITS = '0123456789'
 
-def _parse_a1_part(part: str) -> Dict[str, Optional[int]]:
-    """Parse one side of an A1 range into {col, row} zero-based indices.
+
+def _parse_a1_part(part: str) -> Tuple[Optional[int], Optional[int]]:
+    """Parse one side of an A1 range into zero-based (col, row) indices.
 
     Either component may be None for unbounded sides (e.g. 'A' has no row,
     '5' has no column). Raises ValueError on unparseable input.
+
+    Expects upper-case input: 1-3 letters A-Z, then digits, either part
+    optional. Column letters are capped at 3 chars (Sheets max is "ZZZ"
+    ≈ column 18278, well above the 10,000-column sheet limit); keeping the
+    cap tight also means obvious garbage like "InvalidNotation" still
+    fails parsing.
     """
     if not part:
-        return {'col': None, 'row': None}
-    m = _A1_CELL_RE.match(part)
-    if m:
-        return {'col': column_to_index(m.group(1)), 'row': int(m.group(2)) - 1}
-    m = _A1_COL_RE.match(part)
-    if m:
-        return {'col': column_to_index(m.group(1)), 'row': None}
-    m = _A1_ROW_RE.match(part)
-    if m:
-        return {'col': None, 'row': int(m.group(1)) - 1}
-    raise ValueError(f"Invalid A1 notation component: {part}")
+        return None, None
+    # Split at the letter/digit boundary by hand; cheaper than a regex match
+    # for a grammar this small.
+    letters = part.rstrip(_DIGITS)
+    digits = part[len(letters):]
+    if letters and not (len(letters) <= 3 and letters.isascii() and letters.isalpha()
+                        and letters.isupper()):
+        raise ValueError(f"Invalid A1 notation component: {part}")
+    return (column_to_index(letters) if letters else None,
+            int(digits) - 1 if digits else None)
+
+
+def _parse_a1(a1_notation: str) -> Tuple[Optional[int], Optional[int],
+                                         Optional[int], Optional[int]]:
+    """Parse A1 notation into (startRow, endRow, startCol, endCol).
+
+    Same rules and indices as ``a1_to_grid_range`` (zero-based, ends
+    exclusive), as a plain tuple for callers that only need a corner or
+    two: no dict is built. Row bounds are both None for whole-column refs,
+    column bounds both None for whole-row refs.
+    """
+    # Last '!' only: a quoted sheet name may itself contain one.
+    a1_notation = a1_notation.rpartition('!')[2]
+    a1 = a1_notation.upper().strip()
+    if not a1:
+        raise ValueError("Invalid A1 notation: empty")
+
+    left, sep, right = a1.partition(':')
+    s_col, s_row = _parse_a1_part(left)
+    e_col, e_row = _parse_a1_part(right) if sep else (s_col, s_row)
+
+    # When only one side has a row (e.g. 'A1:A'), mirror it so both bounds
+    # are set; same for columns.
+    if s_row is None:
+        s_row = e_row
+    elif e_row is None:
+        e_row = s_row
+    if s_col is None:
+        s_col = e_col
+    elif e_col is None:
+        e_col = s_col
+
+    if s_row is None and s_col is None:
+        raise ValueError(f"Invalid A1 notation: {a1_notation}")
+    return (s_row, None if e_row is None else e_row + 1,
+            s_col, None if e_col is None else e_col + 1)
 
 
 def a1_to_grid_range(a1_notation: str, sheet_id: int = 0) -> Dict:
@@ -106,39 +166,12 @@ def a1_to_grid_range(a1_notation: str, sheet_id: int = 0) -> Dict:
         >>> a1_to_grid_range('2:5', 0)
         {'sheetId': 0, 'startRowIndex': 1, 'endRowIndex': 5}
     """
-    if '!' in a1_notation:
-        a1_notation = a1_notation.split('!', 1)[1]
-    a1 = a1_notation.upper().strip()
-    if not a1:
-        raise ValueError("Invalid A1 notation: empty")
-
-    if ':' in a1:
-        left, right = a1.split(':', 1)
-        start = _parse_a1_part(left)
-        end = _parse_a1_part(right)
-    else:
-        start = end = _parse_a1_part(a1)
-
+    start_row, end_row, start_col, end_col = _parse_a1(a1_notation)
     result: Dict = {'sheetId': sheet_id}
-
-    # Row component: present if either side specifies a row. When only one
-    # side has it (e.g. 'A1:A'), mirror that value so both bounds are set.
-    s_row, e_row = start['row'], end['row']
-    row_lo = s_row if s_row is not None else e_row
-    row_hi = e_row if e_row is not None else s_row
-    if row_lo is not None and row_hi is not None:
-        result['startRowIndex'] = row_lo
-        result['endRowIndex'] = row_hi + 1  # exclusive
-
-    # Column component: same mirroring rule.
-    s_col, e_col = start['col'], end['col']
-    col_lo = s_col if s_col is not None else e_col
-    col_hi = e_col if e_col is not None else s_col
-    if col_lo is not None and col_hi is not None:
-        result['startColumnIndex'] = col_lo
-        result['endColumnIndex'] = col_hi + 1  # exclusive
-
-    if 'startRowIndex' not in result and 'startColumnIndex' not in result:
-        raise ValueError(f"Invalid A1 notation: {a1_notation}")
-
+    if start_row is not None:
+        result['startRowIndex'] = start_row
+        result['endRowIndex'] = end_row
+    if start_col is not None:
+        result['startColumnIndex'] = start_col
+        result['endColumnIndex'] = end_col
     return result
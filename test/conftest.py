@@ -0,0 +1,38 @@
+"""Test setup shared by every module: src/ on sys.path, mocked-client fixtures."""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Run against the checkout's src/ without installing it. Done here once,
+# before any test module is imported, rather than at the top of each file.
+_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+
+# Integration tests need a real spreadsheet; without one, don't even collect
+# (and so import) the module rather than collecting ten tests to skip.
+collect_ignore = [] if os.environ.get("SHEETS_TEST_SPREADSHEET_ID") else ["test_integration.py"]
+
+
+@pytest.fixture
+def mock_client():
+    """A fresh MagicMock standing in for SheetsClient.
+
+    ``sheet_id()`` is routed through the mock's ``meta_read()``, as the real
+    client does, so tests only configure ``meta_read.return_value``.
+    """
+    c = MagicMock()
+
+    def sheet_id(spreadsheet_id, title):
+        meta = c.meta_read(spreadsheet_id, fields="sheets.properties(sheetId,title)")
+        for sheet in meta.get("sheets", []):
+            if sheet["properties"]["title"] == title:
+                return sheet["properties"]["sheetId"]
+        return None
+
+    c.sheet_id.side_effect = sheet_id
+    return c
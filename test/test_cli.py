@@ -8,18 +8,16 @@ and that stdout/stderr output matches the documented rules.
 import io
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from sheet_cli import cli
 
 
 @pytest.fixture
-def fake_client():
-    c = MagicMock()
+def fake_client(mock_client):
+    c = mock_client
     c.meta_read.return_value = {
         "properties": {"title": "Test"},
         "sheets": [
@@ -44,10 +42,11 @@ def run_cli(argv, fake_client, stdin_text=""):
     out, err = io.StringIO(), io.StringIO()
     exit_code = None
     with patch.object(sys, "argv", ["sheet-cli"] + argv), \
-         patch.object(sys, "stdin", io.StringIO(stdin_text)), \
+         patch.object(sys, "stdin", io.TextIOWrapper(io.BytesIO(stdin_text.encode()))), \
          patch.object(sys, "stdout", out), \
          patch.object(sys, "stderr", err), \
-         patch("sheet_cli.cli.SheetsClient", return_value=fake_client):
+         patch("sheet_cli.cli.SheetsClient", return_value=fake_client), \
+         patch.dict(os.environ, {"SHEET_CLI_SOCKET": os.devnull + ".absent"}):
         # stdin.isatty() needs to return False for pipe detection
         sys.stdin.isatty = lambda: not stdin_text  # type: ignore[method-assign]
         try:
@@ -98,15 +97,13 @@ class TestCliPut:
         _, _, _ = run_cli(["put", "SID:Sheet1"], fake_client,
                           stdin_text='{"A1": "x", "B1": 42}')
         ops = fake_client.write.call_args.args[1]
-        ranges = {op["range"] for op in ops}
-        assert ranges == {"Sheet1!A1", "Sheet1!B1"}
+        assert ops == [{"range": "Sheet1!A1:B1", "values": [["x", 42]]}]
 
     def test_put_stdin_cell_value_text(self, fake_client):
         _, _, _ = run_cli(["put", "SID:Sheet1"], fake_client,
                           stdin_text="A1 hello\nB1 world\n")
         ops = fake_client.write.call_args.args[1]
-        ranges = {op["range"] for op in ops}
-        assert ranges == {"Sheet1!A1", "Sheet1!B1"}
+        assert ops == [{"range": "Sheet1!A1:B1", "values": [["hello", "world"]]}]
 
     def test_put_silent_by_default(self, fake_client):
         stdout, _, _ = run_cli(["put", "SID:Sheet1!A1", "x"], fake_client)
@@ -1,11 +1,10 @@
 """Unit tests for Google Sheets CLI."""
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from unittest.mock import MagicMock, patch
 
 import pytest
-from sheet_client.utils import column_to_index, index_to_column, a1_to_grid_range
+from sheet_client.exceptions import AuthenticationError
+from sheet_client.utils import column_to_index, index_to_column, a1_to_grid_range, _parse_a1
 
 
 class TestColumnConversion:
@@ -56,6 +55,13 @@ class TestColumnConversion:
             col = index_to_column(i)
             assert column_to_index(col) == i
 
+    def test_table_boundary(self):
+        """Last table column and first computed column agree with each other."""
+        assert index_to_column(701) == 'ZZ'
+        assert column_to_index('zz') == 701
+        assert index_to_column(18277) == 'ZZZ'
+        assert column_to_index('ZZZ') == 18277
+
 
 class TestA1ToGridRange:
     """Test A1 notation to GridRange conversion."""
@@ -71,6 +77,23 @@ class TestA1ToGridRange:
             'endColumnIndex': 3
         }
 
+    def test_quoted_sheet_name_with_bang(self):
+        """Only the last '!' separates the sheet from the cells."""
+        result = a1_to_grid_range("'Q1!Q2'!B2:C3", sheet_id=0)
+        assert result == {
+            'sheetId': 0,
+            'startRowIndex': 1,
+            'endRowIndex': 3,
+            'startColumnIndex': 1,
+            'endColumnIndex': 3
+        }
+
+    def test_tuple_form(self):
+        """_parse_a1 gives the same bounds as a tuple, None where unbounded."""
+        assert _parse_a1('Sheet1!B2:C10') == (1, 10, 1, 3)
+        assert _parse_a1('A:B') == (None, None, 0, 2)
+        assert _parse_a1('2:5') == (1, 5, None, None)
+
     def test_single_cell(self):
         """Test single cell range."""
         result = a1_to_grid_range('B5:B5', sheet_id=1)
@@ -223,5 +246,50 @@ class TestExceptions:
         assert error.status_code == 429
 
 
+class TestCredentialsCache:
+    """get_credentials() loads token.json once per process."""
+
+    @pytest.fixture
+    def token(self, tmp_path, monkeypatch):
+        from sheet_client import auth
+        monkeypatch.setattr(auth, 'DEFAULT_CREDS_DIR', tmp_path)
+        monkeypatch.setattr(auth, '_loaded', {})
+        path = tmp_path / 'token.json'
+        path.write_text('{}')
+        creds = MagicMock(valid=True, scopes=auth.SCOPES)
+        with patch('google.oauth2.credentials.Credentials.from_authorized_user_file',
+                   return_value=creds) as load:
+            yield str(path), creds, load
+
+    def test_credentials_cached_across_constructions(self, token):
+        from sheet_client import SheetsClient
+        from sheet_client.auth import get_credentials
+        path, creds, load = token
+        with patch('google_auth_httplib2.AuthorizedHttp') as http:
+            SheetsClient(token_path=path)._http
+            SheetsClient(token_path=path)._http
+        assert load.call_count == 1
+        assert [c.args[0] for c in http.call_args_list] == [creds, creds]
+        assert get_credentials(token_path=path) is creds
+
+    def test_invalid_credentials_reloaded(self, token):
+        from sheet_client.auth import get_credentials
+        path, creds, load = token
+        get_credentials(token_path=path)
+        creds.valid = False
+        creds.expired = False
+        with pytest.raises(AuthenticationError):
+            get_credentials(token_path=path)  # no credentials.json for the flow
+        assert load.call_count == 2
+
+    def test_force_reauth_bypasses_cache(self, token):
+        from sheet_client.auth import get_credentials
+        path, _, load = token
+        get_credentials(token_path=path)
+        with pytest.raises(AuthenticationError):
+            get_credentials(token_path=path, force_reauth=True)
+        assert load.call_count == 1  # token.json was removed, not re-read
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
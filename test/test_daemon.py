@@ -0,0 +1,102 @@
+"""Tests for the `sheet-cli serve` daemon — forwarding, stdin, exit codes."""
+
+import io
+import socket
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sheet_cli import cli, daemon
+
+
+@pytest.fixture
+def shared_client(monkeypatch):
+    c = MagicMock()
+    c.read.return_value = {"range": "Sheet1!A1", "values": [["hello"]]}
+    c.write.return_value = {"totalUpdatedCells": 1}
+    monkeypatch.setattr(cli, "_shared_client", c)
+    return c
+
+
+def exchange(argv, stdin=None):
+    """One request/reply over a socketpair, served by daemon._handle."""
+    client_end, server_end = socket.socketpair()
+    server = threading.Thread(target=lambda: (daemon._handle(server_end),
+                                              server_end.close()))
+    server.start()
+    with client_end:
+        reply = daemon._request(client_end, argv, stdin)
+    server.join()
+    return reply
+
+
+class TestHandle:
+    def test_get_uses_shared_client(self, shared_client):
+        reply = exchange(["get", "SID:Sheet1!A1"])
+        assert reply["code"] == 0
+        assert "hello" in reply["stdout"]
+        shared_client.read.assert_called_once()
+
+    def test_put_reads_forwarded_stdin(self, shared_client):
+        reply = exchange(["put", "SID:Sheet1"], b'{"A1": "x"}')
+        assert reply["code"] == 0
+        ops = shared_client.write.call_args.args[1]
+        assert ops == [{"range": "Sheet1!A1", "values": [["x"]]}]
+
+    def test_no_stdin_looks_like_a_tty(self, shared_client):
+        reply = exchange(["put", "SID:Sheet1!A1"])
+        assert reply["code"] == 1
+        assert "no stdin" in reply["stderr"]
+
+    def test_grammar_error_exit_code(self, shared_client):
+        reply = exchange(["get", ":Sheet1"])
+        assert reply["code"] == 2
+
+    def test_malformed_request(self):
+        client_end, server_end = socket.socketpair()
+        with client_end, server_end:
+            client_end.sendall(b"not json")
+            client_end.shutdown(socket.SHUT_WR)
+            daemon._handle(server_end)
+            server_end.shutdown(socket.SHUT_WR)
+            reply = daemon._recv_all(client_end)
+        assert b"bad request" in reply
+
+
+class TestForward:
+    def test_no_socket_returns_none(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(daemon.SOCKET_ENV, str(tmp_path / "absent"))
+        read = MagicMock()
+        assert daemon.forward(["get"], read) is None
+        read.assert_not_called()  # stdin left for the in-process run
+
+    def test_cli_main_forwards_to_live_daemon(self, tmp_path, monkeypatch,
+                                              shared_client):
+        path = str(tmp_path / "sock")
+        monkeypatch.setenv(daemon.SOCKET_ENV, path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen()
+
+        def serve_one():
+            conn, _ = listener.accept()
+            with conn:
+                daemon._handle(conn)
+
+        server = threading.Thread(target=serve_one)
+        server.start()
+        out = io.StringIO()
+        with patch.object(sys, "argv", ["sheet-cli", "get", "SID:Sheet1!A1"]), \
+             patch.object(sys, "stdout", out), \
+             patch("sheet_cli.cli.SheetsClient") as local_client:
+            cli.main()
+        server.join()
+        listener.close()
+
+        local_client.assert_not_called()
+        assert "hello" in out.getvalue()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -1,20 +1,14 @@
 """Tests for dispatch (do_copy, do_move) — server-side optimizations and fallbacks."""
 
-import os
-import sys
-from unittest.mock import MagicMock
-
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from sheet_cli.dispatch import do_copy, do_move
 from sheet_cli.grammar import GrammarError, Target
 
 
 @pytest.fixture
-def client():
-    c = MagicMock()
+def client(mock_client):
+    c = mock_client
     # Default meta_read: Sheet1→0, Sheet2→123
     c.meta_read.return_value = {
         "sheets": [
@@ -1,13 +1,9 @@
 """Unit tests for CLI format helpers."""
 
-import os
-import sys
 import io
 
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from sheet_cli import formats
 
 
@@ -52,6 +48,16 @@ class TestFormatCellValuePairs:
     def test_none_becomes_empty(self):
         assert formats.format_cell_value_pairs({'A1': None}) == "A1 "
 
+    def test_write_streams_newline_terminated_lines(self):
+        out = io.StringIO()
+        formats.write_cell_value_pairs({'A1': 'hello', 'A2': None}, out)
+        assert out.getvalue() == "A1 hello\nA2 \n"
+
+    def test_write_empty_writes_nothing(self):
+        out = io.StringIO()
+        formats.write_cell_value_pairs({}, out)
+        assert out.getvalue() == ""
+
 
 class TestExpandRangeToCells:
     def test_2x2(self):
@@ -80,6 +86,10 @@ class TestExpandRangeToCells:
         assert result == {'C3': 'x', 'D3': 'y'}
 
 
+    def test_quoted_sheet_name_with_bang(self):
+        result = formats.expand_range_to_cells("'A!b'!C3", [[1, 2]])
+        assert result == {"'A!b'!C3": 1, "'A!b'!D3": 2}
+
 class TestDetectFormat:
     def test_json_object(self):
         assert formats.detect_format('{"A1": "x"}') == 'json'
@@ -101,19 +111,25 @@ class TestParseInput:
     def test_cell_value_dispatch(self):
         assert formats.parse_input("A1 hello") == {'A1': 'hello'}
 
+    def test_bytes_json(self):
+        assert formats.parse_input(b' {"A1": "h\xc3\xa9"}') == {'A1': 'h\u00e9'}
+
+    def test_bytes_cell_value(self):
+        assert formats.parse_input(b"A1 h\xc3\xa9\n") == {'A1': 'h\u00e9'}
+
 
 class TestReadStdin:
-    def test_non_tty_reads(self, monkeypatch):
-        fake = io.StringIO("piped\n")
+    def test_non_tty_reads_bytes(self, monkeypatch):
+        fake = io.TextIOWrapper(io.BytesIO(b"piped\n"))
         fake.isatty = lambda: False  # pyright: ignore[reportAttributeAccessIssue]
         monkeypatch.setattr(sys, 'stdin', fake)
-        assert formats.read_stdin() == "piped\n"
+        assert formats.read_stdin() == b"piped\n"
 
     def test_tty_returns_empty(self, monkeypatch):
-        fake = io.StringIO("")
+        fake = io.TextIOWrapper(io.BytesIO(b""))
         fake.isatty = lambda: True  # pyright: ignore[reportAttributeAccessIssue]
         monkeypatch.setattr(sys, 'stdin', fake)
-        assert formats.read_stdin() == ""
+        assert formats.read_stdin() == b""
 
 
 if __name__ == '__main__':
@@ -1,12 +1,7 @@
 """Tests for the target-string grammar module."""
 
-import os
-import sys
-
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from sheet_cli.grammar import (
     GrammarError,
     ParsedTarget,
@@ -10,6 +10,8 @@ Set SHEETS_TEST_SPREADSHEET_ID environment variable to run these tests.
 Usage:
     export SHEETS_TEST_SPREADSHEET_ID="your-spreadsheet-id-here"
     pytest test_integration.py -v -s
+
+API requests are paced to SHEETS_TEST_RATE_PER_MINUTE (default 50).
 """
 
 import os
@@ -17,29 +19,79 @@ import sys
 import pytest
 import time
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from sheet_client import SheetsClient, CellData
 
 
-# Skip all tests if SHEETS_TEST_SPREADSHEET_ID not set
+# conftest.py keeps this module out of a plain `pytest test/` run without a
+# spreadsheet; this covers naming the file explicitly.
 pytestmark = pytest.mark.skipif(
     not os.environ.get('SHEETS_TEST_SPREADSHEET_ID'),
     reason="Set SHEETS_TEST_SPREADSHEET_ID environment variable to run integration tests"
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spreadsheet_id():
     """Get test spreadsheet ID from environment."""
     return os.environ.get('SHEETS_TEST_SPREADSHEET_ID')
 
 
-@pytest.fixture
+# Sheets allows 60 requests/minute/user by default; stay under it so
+# repeated runs don't end in 429 retry storms.
+_RATE_PER_MINUTE = float(os.environ.get('SHEETS_TEST_RATE_PER_MINUTE', '50'))
+
+
+class _PacedClient(SheetsClient):
+    """SheetsClient that spaces API requests at least 60/N seconds apart.
+
+    Every call goes through ``_execute_with_retry``, so pacing there covers
+    read/write/meta_* alike; 429s that still happen get its usual backoff.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._interval = 60.0 / _RATE_PER_MINUTE if _RATE_PER_MINUTE > 0 else 0.0
+        self._last = None
+
+    def _execute_with_retry(self, request, max_retries=3):
+        if self._last is not None:
+            delay = self._interval - (time.monotonic() - self._last)
+            if delay > 0:
+                time.sleep(delay)
+        try:
+            return super()._execute_with_retry(request, max_retries)
+        finally:
+            self._last = time.monotonic()
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create SheetsClient (no default spreadsheet_id)."""
-    return SheetsClient()
+    """One SheetsClient (no default spreadsheet_id) for the whole run.
+
+    Loads the token and builds the service once rather than per test.
+    Requests are paced to SHEETS_TEST_RATE_PER_MINUTE (default 50; 0 = off).
+    """
+    return _PacedClient()
+
+
+@pytest.fixture(scope="session")
+def seeded_cells(client, spreadsheet_id):
+    """Write every cell the read-back tests check, in one batchUpdate.
+
+    One write-quota slot per run instead of one per test; fails fast if
+    the batch didn't land.
+    """
+    text_value = f"Test_{int(time.time())}"
+    result = client.write(spreadsheet_id, [
+        {'range': 'Sheet1!Z1', 'values': [[text_value]]},
+        {'range': 'Sheet1!Z2', 'values': [['=1+1']]},
+    ])
+    assert result['totalUpdatedCells'] == 2
+    return {
+        'text_cell': 'Sheet1!Z1',
+        'text_value': text_value,
+        'formula_cell': 'Sheet1!Z2',
+    }
 
 
 class TestOAuthFlow:
@@ -47,7 +99,7 @@ class TestOAuthFlow:
 
     def test_oauth_flow_creates_token(self, client):
         """Test that OAuth flow works and creates token file."""
-        # Simply creating the client should trigger OAuth if needed
+        # First use of the client's service triggers OAuth if needed
         assert client is not None
         assert client.service is not None
 
@@ -56,11 +108,12 @@ class TestOAuthFlow:
         assert os.path.exists(token_path), \
             "~/.sheet-cli/token.json should be created after OAuth flow"
 
-    def test_cached_token_reused(self, client):
+    def test_cached_token_reused(self):
         """Test that cached token is reused on subsequent runs."""
         # This should not trigger browser if token exists
         client2 = SheetsClient()
-        assert client2 is not None
+        client2.connect()
+        assert client2.service is not None
 
 
 class TestBasicOperations:
@@ -83,55 +136,26 @@ class TestBasicOperations:
         assert 'spreadsheetId' in result or 'range' in result
         # values may be empty if cell is empty
 
-    def test_write_read_roundtrip(self, client, spreadsheet_id):
-        """Test writing and reading back a value."""
-        # Generate unique test value with timestamp
-        test_value = f"Test_{int(time.time())}"
-
-        # Write to cell
-        write_result = client.write(
-            spreadsheet_id,
-            [{'range': 'Sheet1!Z1', 'values': [[test_value]]}]
-        )
-
-        assert 'totalUpdatedCells' in write_result
-        assert write_result['totalUpdatedCells'] >= 1
-
-        # Read it back
-        read_result = client.read(spreadsheet_id, ['Sheet1!Z1'])
+    def test_write_read_roundtrip(self, client, spreadsheet_id, seeded_cells):
+        """Test reading back a written value."""
+        read_result = client.read(spreadsheet_id, [seeded_cells['text_cell']])
 
         assert 'values' in read_result
-        assert read_result['values'][0][0] == test_value
-
-    def test_formula_write_read(self, client, spreadsheet_id):
-        """Test writing and reading a formula."""
-        # Write formula
-        write_result = client.write(
-            spreadsheet_id,
-            [{'range': 'Sheet1!Z2', 'values': [['=1+1']]}]
-        )
-
-        assert write_result['totalUpdatedCells'] >= 1
-
-        # Read as value (should show calculated result)
-        value_result = client.read(
-            spreadsheet_id,
-            ['Sheet1!Z2'],
-            types=CellData.VALUE
-        )
-
-        assert 'values' in value_result
-        assert value_result['values'][0][0] == 2
+        assert read_result['values'][0][0] == seeded_cells['text_value']
 
-        # Read as formula (should show formula string)
-        formula_result = client.read(
+    def test_formula_write_read(self, client, spreadsheet_id, seeded_cells):
+        """Test reading back a written formula."""
+        # One grid read returns both the calculated value (VALUE) and the
+        # formula as entered (FORMULA); NOTE selects the grid endpoint.
+        result = client.read(
             spreadsheet_id,
-            ['Sheet1!Z2'],
-            types=CellData.FORMULA
+            [seeded_cells['formula_cell']],
+            types=CellData.VALUE | CellData.FORMULA | CellData.NOTE
         )
 
-        assert 'values' in formula_result
-        assert formula_result['values'][0][0] == '=1+1'
+        data = result['sheets'][0]['data'][0]['rowData'][0]['values'][0]
+        assert data['effectiveValue'] == {'numberValue': 2}
+        assert data['userEnteredValue'] == {'formulaValue': '=1+1'}
 
 
 class TestMultipleSpreadsheets:
@@ -6,18 +6,25 @@ the Google Sheets REST API shape. Each handler is exercised through
 is also covered.
 """
 
-import os
-import sys
-
 import pytest
 from unittest.mock import MagicMock
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 from sheet_cli.grammar import GrammarError, PropertyRef, Target, TargetType
 from sheet_cli.properties import dispatch, supported
 
 
+def _answer_sheet_id(c):
+    """Route the mock's sheet_id() through its meta_read(), as the client does."""
+    def sheet_id(spreadsheet_id, title):
+        meta = c.meta_read(spreadsheet_id, fields="sheets.properties(sheetId,title)")
+        for sheet in meta.get("sheets", []):
+            if sheet["properties"]["title"] == title:
+                return sheet["properties"]["sheetId"]
+        return None
+    c.sheet_id.side_effect = sheet_id
+    return c
+
+
 def _client(meta=None, write_reply=None, read_reply=None):
     c = MagicMock()
     c.meta_read.return_value = meta or {
@@ -52,7 +59,7 @@ def _client(meta=None, write_reply=None, read_reply=None):
             }],
         }],
     }
-    return c
+    return _answer_sheet_id(c)
 
 
 def _target(sid="SID", sheet="Sheet1", locator=None, prop_name=None, key=None):
@@ -183,6 +190,25 @@ class TestRangeFormat:
         with pytest.raises(GrammarError):
             dispatch("put", c, t, "not a dict")
 
+    def test_put_grid_is_one_updateCells(self):
+        c = _client()
+        t = _target(locator="B2:C3", prop_name="format")
+        bold = {"textFormat": {"bold": True}}
+        dispatch("put", c, t, [[bold, {}], [{}, bold]])
+        reqs = c.meta_write.call_args[0][1]
+        assert len(reqs) == 1
+        uc = reqs[0]["updateCells"]
+        assert uc["start"] == {"sheetId": 42, "rowIndex": 1, "columnIndex": 1}
+        assert uc["rows"][0]["values"] == [{"userEnteredFormat": bold},
+                                           {"userEnteredFormat": {}}]
+        assert uc["fields"] == "userEnteredFormat"
+
+    def test_put_grid_rejects_non_dict_cells(self):
+        c = _client()
+        t = _target(locator="A1:B1", prop_name="format")
+        with pytest.raises(GrammarError):
+            dispatch("put", c, t, [["bold"]])
+
 
 class TestRangeBorders:
     def test_del_uses_NONE_style(self):
@@ -650,6 +676,17 @@ class TestRangeNote:
         assert req["repeatCell"]["cell"]["note"] == "hello"
         assert req["repeatCell"]["fields"] == "note"
 
+    def test_put_note_grid(self):
+        c = _client()
+        t = _target(locator="A1:B2", prop_name="note")
+        dispatch("put", c, t, [["a", "b"], ["", 3]])
+        uc = c.meta_write.call_args[0][1][0]["updateCells"]
+        assert uc["rows"] == [
+            {"values": [{"note": "a"}, {"note": "b"}]},
+            {"values": [{"note": ""}, {"note": "3"}]},
+        ]
+        assert uc["fields"] == "note"
+
 
 # ---------------------------- sheet properties ----------------------------
 
@@ -1,37 +1,61 @@
 """Tests for _execute_with_retry backoff behavior."""
 
+import operator
 import os
 import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from sheet_client import SheetsClient
+from sheet_client import CellData, SheetsClient
 from sheet_client.exceptions import RateLimitError, ServerError, SheetsAPIError
 
 
-def _http_error(status):
-    """Construct a googleapiclient HttpError-like mock with a .resp.status."""
+def _http_error(status, headers=None):
+    """Construct a googleapiclient HttpError with a real httplib2 response."""
+    import httplib2
     from googleapiclient.errors import HttpError
-    resp = MagicMock()
-    resp.status = status
+    resp = httplib2.Response(dict(headers or {}, status=status))
     return HttpError(resp=resp, content=b'err')
 
 
+@pytest.fixture(scope='module')
+def _real_build():
+    """googleapiclient's build(), taken before _patched_api replaces it.
+
+    Imported here rather than at module top so collecting this file doesn't
+    load the discovery stack.
+    """
+    from googleapiclient.discovery import build
+    return build
+
+
+@pytest.fixture(scope='module')
+def _patched_api(_real_build):
+    """Stub credentials and discovery once for the whole module."""
+    with patch('sheet_client.client.get_credentials') as creds, \
+         patch('googleapiclient.discovery.build') as build:
+        yield creds, build
+
+
 @pytest.fixture
-def client():
-    with patch('sheet_client.client.get_credentials'), \
-         patch('sheet_client.client.build'):
-        yield SheetsClient()
+def api(_patched_api):
+    """The (get_credentials, build) mocks, reset to a fresh state per test."""
+    for mock in _patched_api:
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _patched_api
+
+
+@pytest.fixture
+def client(api):
+    return SheetsClient()
 
 
 @pytest.fixture(autouse=True)
 def no_sleep():
     """Make retries instant."""
-    with patch('sheet_client.client.time.sleep'):
-        yield
+    with patch('sheet_client.client.time.sleep') as sleep:
+        yield sleep
 
 
 class TestRetry:
@@ -67,6 +91,13 @@ class TestRetry:
             client._execute_with_retry(req)
         assert info.value.status_code == 503
 
+    @pytest.mark.parametrize('status', [502, 504])
+    def test_gateway_errors_retried(self, client, status):
+        req = MagicMock()
+        req.execute.side_effect = [_http_error(status), {'ok': True}]
+        assert client._execute_with_retry(req) == {'ok': True}
+        assert req.execute.call_count == 2
+
     def test_400_no_retry(self, client):
         req = MagicMock()
         req.execute.side_effect = _http_error(400)
@@ -84,13 +115,166 @@ class TestRetry:
         assert req.execute.call_count == 1
 
 
+    def test_non_http_error_propagates(self, client):
+        req = MagicMock()
+        req.execute.side_effect = ConnectionResetError()
+        with pytest.raises(ConnectionResetError):
+            client._execute_with_retry(req)
+        assert req.execute.call_count == 1
+
+
+class TestBackoff:
+    def test_jittered_and_capped(self, client, no_sleep):
+        req = MagicMock()
+        req.execute.side_effect = [_http_error(503)] * 9 + [{'ok': True}]
+        client._execute_with_retry(req, max_retries=10)
+        waits = [c.args[0] for c in no_sleep.call_args_list]
+        assert len(waits) == 9
+        assert all(0 <= w <= min(2 ** i, 32) for i, w in enumerate(waits))
+
+    def test_retry_after_header_wins(self, client, no_sleep):
+        req = MagicMock()
+        req.execute.side_effect = [_http_error(429, {'retry-after': '7'}),
+                                   {'ok': True}]
+        client._execute_with_retry(req)
+        no_sleep.assert_called_once_with(7.0)
+
+    def test_retry_after_http_date(self, client, no_sleep):
+        import email.utils
+        import time
+        when = email.utils.formatdate(time.time() + 10, usegmt=True)
+        req = MagicMock()
+        req.execute.side_effect = [_http_error(503, {'retry-after': when}),
+                                   {'ok': True}]
+        client._execute_with_retry(req)
+        assert 8 <= no_sleep.call_args.args[0] <= 10
+
+    def test_unparseable_retry_after_falls_back(self, client, no_sleep):
+        req = MagicMock()
+        req.execute.side_effect = [_http_error(429, {'retry-after': 'soon'}),
+                                   {'ok': True}]
+        client._execute_with_retry(req)
+        assert 0 <= no_sleep.call_args.args[0] <= 1
+
+    def test_no_sleep_after_last_attempt(self, client, no_sleep):
+        req = MagicMock()
+        req.execute.side_effect = _http_error(429)
+        with pytest.raises(RateLimitError):
+            client._execute_with_retry(req, max_retries=3)
+        assert no_sleep.call_count == 2
+
+
+class TestTransport:
+    def test_import_does_not_load_api_client(self):
+        import subprocess
+        src = os.path.join(os.path.dirname(__file__), '..', 'src')
+        code = ("import sys; sys.path.insert(0, %r); import sheet_cli.cli; "
+                "print(any(m.split('.')[0] in ('googleapiclient', 'httplib2') "
+                "for m in sys.modules))" % src)
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                             text=True, check=True).stdout
+        assert out.strip() == 'False'
+
+    def test_nothing_loaded_until_used(self, api):
+        creds, build = api
+        client = SheetsClient()
+        creds.assert_not_called()
+        build.assert_not_called()
+        client.connect()
+        assert creds.call_count == 1
+        assert [c.args[0] for c in build.call_args_list] == ['sheets']
+
+    def test_services_share_one_http(self, client, api):
+        _, build = api
+        assert client.spreadsheets and client.drive
+        https = [c.kwargs['http'] for c in build.call_args_list]
+        assert len(https) == 2
+        assert https[0] is https[1] is client._http
+
+    def test_get_reuses_client_per_credentials(self, api):
+        creds, _ = api
+        with patch.dict('sheet_client.client._CLIENT_CACHE', clear=True):
+            first = SheetsClient.get()
+            assert SheetsClient.get() is first
+            other = SheetsClient.get(token_path='/other')
+            assert other is not first
+            for client in (first, SheetsClient.get(), other):
+                client.connect()
+        assert creds.call_count == 2
+
+    def test_values_resource_built_once(self, client):
+        client.read('SID', ['A1'])
+        client.write('SID', [{'range': 'A1', 'values': [[1]]}])
+        client.clear('SID', ['A1'])
+        assert client.spreadsheets.values.call_count == 1
+
+    def test_orjson_model_when_available(self, client, api):
+        orjson = pytest.importorskip('orjson')
+        client.connect()
+        model = api[1].call_args.kwargs['model']
+        assert model.deserialize(b'{"values": [[1, "a"]]}') == {'values': [[1, 'a']]}
+        assert orjson.loads(model.serialize({'data': [1]})) == {'data': [1]}
+        assert model.deserialize(b'not json') == 'not json'
+
+    def test_discovery_is_static(self, client, api):
+        _, build = api
+        assert client.spreadsheets and client.drive
+        assert build.call_count == 2
+        for call in build.call_args_list:
+            assert call.kwargs['static_discovery'] is True
+
+    def test_building_services_sends_no_request(self, client, api, _real_build):
+        # Real build(): with static discovery, neither service fetches
+        # anything over the transport while being built.
+        api[1].side_effect = _real_build
+        base = MagicMock()
+        send = base.request
+        with patch('googleapiclient.http.build_http', return_value=base):
+            client.spreadsheets.values()
+            client.drive.files()
+        send.assert_not_called()
+
+    def test_requests_carry_user_agent(self, client):
+        base = MagicMock()
+        send = base.request
+        send.return_value = (MagicMock(), b'')
+        with patch('googleapiclient.http.build_http', return_value=base):
+            client.connect()
+        client._http.http.request('https://example', headers={'user-agent': '(gzip)'})
+        headers = send.call_args.kwargs['headers']
+        assert headers['user-agent'] == 'sheet-cli/0.1.0 (gzip)'
+
+
+@pytest.mark.parametrize('method, api_chain, args', [
+    ('read', 'values.return_value.get', (['A1'],)),
+    ('read', 'values.return_value.batchGet', (['A1', 'B1'],)),
+    ('write', 'values.return_value.batchUpdate', ([{'range': 'A1', 'values': [[1]]}],)),
+    ('clear', 'values.return_value.batchClear', (['A1'],)),
+    ('meta_read', 'get', ()),
+    ('meta_write', 'batchUpdate', ([{'addSheet': {'properties': {'title': 'T'}}}],)),
+])
+def test_spreadsheet_id_passed_per_call(client, method, api_chain, args):
+    getattr(client, method)('SID', *args)
+    api = operator.attrgetter(api_chain)(client.spreadsheets)
+    assert api.call_args.kwargs['spreadsheetId'] == 'SID'
+
+
+def test_one_client_many_spreadsheets(client):
+    # The MCP server's pattern: one client, a different spreadsheet per call.
+    calls = [('sheet-1', 'A1'), ('sheet-2', 'B1'), ('sheet-3', 'C1')]
+    for sid, rng in calls:
+        client.read(sid, [rng])
+    get = client.spreadsheets.values.return_value.get
+    assert [(c.kwargs['spreadsheetId'], c.kwargs['range'])
+            for c in get.call_args_list] == calls
+
+
 class TestClearMethod:
     def test_clear_calls_batch_clear(self, client):
-        mock_values = MagicMock()
+        mock_values = client.spreadsheets.values.return_value
         mock_req = MagicMock()
         mock_req.execute.return_value = {'clearedRanges': ['A1:B2']}
         mock_values.batchClear.return_value = mock_req
-        client.spreadsheets.values.return_value = mock_values
 
         result = client.clear('SID', ['A1:B2'])
 
@@ -101,5 +285,319 @@ class TestClearMethod:
         assert kwargs['body'] == {'ranges': ['A1:B2']}
 
 
+class TestMetaRead:
+    def test_default_requests_everything(self, client):
+        client.meta_read('SID')
+        kwargs = client.spreadsheets.get.call_args.kwargs
+        assert kwargs == {'spreadsheetId': 'SID', 'includeGridData': False}
+
+    def test_fields_mask_passed_through(self, client):
+        client.meta_read('SID', fields='sheets.properties(sheetId,title)')
+        kwargs = client.spreadsheets.get.call_args.kwargs
+        assert kwargs['fields'] == 'sheets.properties(sheetId,title)'
+
+
+class TestMetaCache:
+    @pytest.fixture
+    def cached(self, api):
+        return SheetsClient(meta_ttl=60)
+
+    def test_off_by_default(self, client):
+        client.meta_read('SID')
+        client.meta_read('SID')
+        assert client.spreadsheets.get.call_count == 2
+
+    def test_hits_per_fields_mask(self, cached):
+        cached.meta_read('SID')
+        cached.meta_read('SID')
+        cached.meta_read('SID', fields='properties.title')
+        assert cached.spreadsheets.get.call_count == 2
+
+    def test_expires(self, cached):
+        with patch('sheet_client.client.time.monotonic', side_effect=[0.0, 61.0]):
+            cached.meta_read('SID')
+            cached.meta_read('SID')
+        assert cached.spreadsheets.get.call_count == 2
+
+    def test_structure_writes_invalidate(self, cached):
+        cached.meta_read('SID')
+        cached.meta_write('SID', [{'addSheet': {}}])
+        cached.meta_read('SID')
+        cached.invalidate_metadata()
+        cached.meta_read('SID')
+        assert cached.spreadsheets.get.call_count == 3
+
+    def test_shared_cache_between_clients(self, cached):
+        other = SheetsClient(meta_ttl=60, meta_cache=cached._meta_cache)
+        cached.meta_read('SID')
+        other.meta_read('SID')
+        # Both clients sit on the same stubbed service: one call in total
+        # means the second read was served from the shared cache.
+        assert other.spreadsheets.get.call_count == 1
+
+
+class TestSheetIdCache:
+    META = {'sheets': [{'properties': {'sheetId': 7, 'title': 'Data'}}]}
+
+    def test_lookups_share_one_meta_read(self, client):
+        client.spreadsheets.get.return_value.execute.return_value = self.META
+        assert client.sheet_id('SID', 'Data') == 7
+        assert client.sheet_id('SID', 'Data') == 7
+        assert client.spreadsheets.get.call_count == 1
+        assert client.spreadsheets.get.call_args.kwargs['fields'] == \
+            'sheets.properties(sheetId,title)'
+
+    def test_meta_write_invalidates(self, client):
+        client.spreadsheets.get.return_value.execute.return_value = self.META
+        client.sheet_id('SID', 'Data')
+        client.meta_write('SID', [{'addSheet': {}}])
+        client.sheet_id('SID', 'Data')
+        assert client.spreadsheets.get.call_count == 2
+
+    def test_unknown_title_refetches_then_none(self, client):
+        client.spreadsheets.get.return_value.execute.return_value = self.META
+        client.sheet_id('SID', 'Data')
+        assert client.sheet_id('SID', 'Ghost') is None
+        assert client.spreadsheets.get.call_count == 2
+
+
+class TestReadArgs:
+    def test_no_ranges_makes_no_call(self, client):
+        assert client.read('SID', []) == {'spreadsheetId': 'SID', 'valueRanges': []}
+        client.spreadsheets.values.return_value.batchGet.assert_not_called()
+        client.spreadsheets.get.assert_not_called()
+
+
+    def test_undefined_flag_bits_rejected(self, client):
+        with pytest.raises(ValueError, match='0b10001'):
+            client.read('SID', ['A1'], types=CellData.VALUE | 16)
+        client.spreadsheets.values.return_value.get.assert_not_called()
+
+    def test_repeated_ranges_fetched_once(self, client):
+        batch_get = client.spreadsheets.values.return_value.batchGet
+        batch_get.return_value.execute.return_value = {'valueRanges': [
+            {'range': 'S!A1', 'values': [[1]]}, {'range': 'S!B1', 'values': [[2]]}]}
+        result = client.read('SID', ['A1', 'B1', 'A1'])
+        assert batch_get.call_args.kwargs['ranges'] == ['A1', 'B1']
+        assert [vr['values'] for vr in result['valueRanges']] == [[[1]], [[2]], [[1]]]
+
+    def test_dedupe_off_sends_ranges_as_given(self, client):
+        batch_get = client.spreadsheets.values.return_value.batchGet
+        client.read('SID', ['A1', 'A1'], dedupe=False)
+        assert batch_get.call_args.kwargs['ranges'] == ['A1', 'A1']
+
+
+class TestGridRead:
+    def test_fields_follow_types(self, client):
+        client.read('SID', ['S!A1:B2'], types=CellData.VALUE | CellData.NOTE)
+        fields = client.spreadsheets.get.call_args.kwargs['fields']
+        assert 'properties(sheetId,title)' in fields
+        assert 'values(formattedValue,effectiveValue,note)' in fields
+        assert 'userEnteredFormat' not in fields
+        assert 'merges' not in fields
+
+    def test_format_only(self, client):
+        client.read('SID', ['S!A1'], types=CellData.FORMAT)
+        fields = client.spreadsheets.get.call_args.kwargs['fields']
+        assert 'values(userEnteredFormat)' in fields
+        # merge and row height/width lookups read these off the grid response
+        assert 'merges' in fields
+        assert 'rowMetadata,columnMetadata' in fields
+
+    def test_sheets_fetched_separately_and_merged(self, client):
+        replies = {
+            ('A!A1', 'A!B2'): {'spreadsheetId': 'SID', 'sheets': [
+                {'properties': {'sheetId': 1, 'title': 'A'}, 'data': ['a']}]},
+            ('B!A1',): {'spreadsheetId': 'SID', 'sheets': [
+                {'properties': {'sheetId': 2, 'title': 'B'}, 'data': ['b']}]},
+            ('A1',): {'spreadsheetId': 'SID', 'sheets': [
+                {'properties': {'sheetId': 1, 'title': 'A'}, 'data': ['a0']}]},
+        }
+
+        def get(**kwargs):
+            request = MagicMock()
+            request.execute.return_value = replies[tuple(kwargs['ranges'])]
+            return request
+        client.spreadsheets.get.side_effect = get
+
+        result = client.read('SID', ['A!A1', 'B!A1', 'A!B2', 'A1'], types=CellData.NOTE)
+        assert client.spreadsheets.get.call_count == 3
+        assert result['sheets'] == [
+            {'properties': {'sheetId': 1, 'title': 'A'}, 'data': ['a', 'a0']},
+            {'properties': {'sheetId': 2, 'title': 'B'}, 'data': ['b']},
+        ]
+
+
+class TestReadStream:
+    def test_yields_rows_from_raw_body(self, client):
+        get = client.spreadsheets.values.return_value.get
+        get.return_value.execute.return_value = (
+            b'{"range": "S!A1:B2", "values": [["a", 1], ["b", 2.5]]}')
+        rows = list(client.read_stream('SID', 'S!A1:B2'))
+        assert rows == [['a', 1], ['b', 2.5]]
+        request = get.return_value
+        assert request.postproc(None, b'raw') == b'raw'
+
+    def test_empty_range(self, client):
+        get = client.spreadsheets.values.return_value.get
+        get.return_value.execute.return_value = b'{"range": "S!A1"}'
+        assert list(client.read_stream('SID', 'S!A1')) == []
+
+    def test_grid_read_yields_row_data(self, client):
+        get = client.spreadsheets.get
+        get.return_value.execute.return_value = (
+            b'{"sheets": [{"data": [{"rowData": ['
+            b'{"values": [{"note": "x"}]}, {"values": [{}]}]}]}]}')
+        rows = list(client.read_stream('SID', 'S!A1:A2', types=CellData.NOTE))
+        assert rows == [{'values': [{'note': 'x'}]}, {'values': [{}]}]
+        assert get.call_args.kwargs['ranges'] == ['S!A1:A2']
+
+
+class TestReadAsync:
+    def test_queued_reads_share_one_batch_get(self, client):
+        batch_get = client.spreadsheets.values.return_value.batchGet
+        batch_get.return_value.execute.return_value = {'valueRanges': [
+            {'range': 'S!A1', 'values': [['a']]},
+            {'range': 'S!B2', 'values': [['b']]},
+        ]}
+        first = client.read_async('SID', 'S!A1')
+        second = client.read_async('SID', 'S!B2')
+        batch_get.assert_not_called()
+
+        assert first.result() == {'range': 'S!A1', 'values': [['a']]}
+        assert second.result() == {'range': 'S!B2', 'values': [['b']]}
+        batch_get.assert_called_once_with(
+            spreadsheetId='SID', ranges=['S!A1', 'S!B2'],
+            valueRenderOption='FORMATTED_VALUE')
+
+    def test_groups_by_spreadsheet_and_render(self, client):
+        batch_get = client.spreadsheets.values.return_value.batchGet
+        batch_get.return_value.execute.return_value = {'valueRanges': [{}]}
+        client.read_async('SID', 'A1')
+        client.read_async('SID', 'A1', types=CellData.FORMULA)
+        client.read_async('OTHER', 'A1')
+        client.flush_reads()
+        assert batch_get.call_count == 3
+
+    def test_error_reaches_every_future(self, client):
+        batch_get = client.spreadsheets.values.return_value.batchGet
+        batch_get.return_value.execute.side_effect = _http_error(404)
+        futures = [client.read_async('SID', r) for r in ('A1', 'B1')]
+        for f in futures:
+            with pytest.raises(SheetsAPIError):
+                f.result()
+        assert batch_get.return_value.execute.call_count == 1
+
+    def test_format_rejected(self, client):
+        with pytest.raises(ValueError):
+            client.read_async('SID', 'A1', types=CellData.FORMAT)
+
+
+class TestWriteSplitting:
+    def _values(self, client, results):
+        mock_values = client.spreadsheets.values.return_value
+        reqs = []
+        for r in results:
+            req = MagicMock()
+            req.execute.return_value = r
+            reqs.append(req)
+        mock_values.batchUpdate.side_effect = reqs
+        return mock_values
+
+    def test_plain_entries_sent_without_copy(self, client):
+        mock_values = self._values(client, [{}])
+        entry = {'range': 'A1', 'values': [[1]]}
+        client.write('SID', [entry, {'range': 'B1', 'values': [[2]], 'tag': 'x'}])
+        sent = mock_values.batchUpdate.call_args.kwargs['body']['data']
+        assert sent[0] is entry
+        assert sent[1] == {'range': 'B1', 'values': [[2]]}
+
+    def test_small_write_is_one_call(self, client):
+        mock_values = self._values(client, [{'totalUpdatedCells': 2}])
+        result = client.write('SID', [{'range': 'A1', 'values': [[1, 2]]}])
+        assert result == {'totalUpdatedCells': 2}
+        assert mock_values.batchUpdate.call_count == 1
+        assert mock_values.batchUpdate.call_args.kwargs['body']['valueInputOption'] == 'USER_ENTERED'
+
+    def test_raw_input_option_passed_through(self, client):
+        mock_values = self._values(client, [{}])
+        client.write('SID', [{'range': 'A1', 'values': [[1.5]]}], value_input_option='RAW')
+        assert mock_values.batchUpdate.call_args.kwargs['body']['valueInputOption'] == 'RAW'
+
+    def test_large_write_is_split_and_merged(self, client):
+        block = [[0] * 100] * 200   # 20,000 cells per range
+        data = [{'range': f'Sheet1!A{i}', 'values': block} for i in range(3)]
+        mock_values = self._values(client, [
+            {'totalUpdatedCells': 20000, 'responses': ['a']},
+            {'totalUpdatedCells': 20000, 'responses': ['b']},
+            {'totalUpdatedCells': 20000, 'responses': ['c']},
+        ])
+        result = client.write('SID', data)
+        assert mock_values.batchUpdate.call_count == 3
+        sent = [c.kwargs['body']['data'][0]['range']
+                for c in mock_values.batchUpdate.call_args_list]
+        assert sent == ['Sheet1!A0', 'Sheet1!A1', 'Sheet1!A2']
+        assert result['totalUpdatedCells'] == 60000
+        assert result['responses'] == ['a', 'b', 'c']
+
+
+class TestFusedWrite:
+    def test_format_and_note_share_one_batch_update(self, client):
+        client.spreadsheets.get.return_value.execute.return_value = {'sheets': [
+            {'properties': {'sheetId': 7, 'title': "Bob's"}}]}
+        client.spreadsheets.batchUpdate.return_value.execute.return_value = {'replies': []}
+        client.write('SID', [
+            {'range': "'Bob''s'!B2", 'values': [[1, '=A1'], [None, 'x']],
+             'format': {'textFormat': {'bold': True}}},
+            {'range': "'Bob''s'!D4", 'values': [[True]], 'note': [['hi']]},
+        ])
+        assert client.spreadsheets.values.return_value.batchUpdate.call_count == 0
+        requests = client.spreadsheets.batchUpdate.call_args.kwargs['body']['requests']
+        bold = {'textFormat': {'bold': True}}
+        assert requests[0] == {'updateCells': {
+            'start': {'sheetId': 7, 'rowIndex': 1, 'columnIndex': 1},
+            'rows': [
+                {'values': [
+                    {'userEnteredValue': {'numberValue': 1}, 'userEnteredFormat': bold},
+                    {'userEnteredValue': {'formulaValue': '=A1'}, 'userEnteredFormat': bold},
+                ]},
+                {'values': [
+                    {'userEnteredFormat': bold},
+                    {'userEnteredValue': {'stringValue': 'x'}, 'userEnteredFormat': bold},
+                ]},
+            ],
+            'fields': 'userEnteredValue,userEnteredFormat',
+        }}
+        assert requests[1]['updateCells']['rows'] == [
+            {'values': [{'userEnteredValue': {'boolValue': True}, 'note': 'hi'}]}]
+        assert requests[1]['updateCells']['fields'] == 'userEnteredValue,note'
+
+    def test_unqualified_range_rejected(self, client):
+        with pytest.raises(ValueError):
+            client.write('SID', [{'range': 'A1', 'values': [[1]], 'note': 'x'}])
+
+
+class TestMetaWriteChunking:
+    def test_small_batch_is_one_call(self, client):
+        client.spreadsheets.batchUpdate.return_value.execute.return_value = {'replies': [{}]}
+        result = client.meta_write('SID', [{'addSheet': {}}])
+        assert result == {'replies': [{}]}
+        assert client.spreadsheets.batchUpdate.call_count == 1
+
+    def test_large_batch_is_chunked_and_merged(self, client):
+        requests = [{'deleteNamedRange': {'namedRangeId': str(i)}} for i in range(1201)]
+        reqs = []
+        for n in (500, 500, 201):
+            req = MagicMock()
+            req.execute.return_value = {'spreadsheetId': 'SID', 'replies': [{}] * n}
+            reqs.append(req)
+        client.spreadsheets.batchUpdate.side_effect = reqs
+        result = client.meta_write('SID', requests)
+        sizes = [len(c.kwargs['body']['requests'])
+                 for c in client.spreadsheets.batchUpdate.call_args_list]
+        assert sizes == [500, 500, 201]
+        assert result == {'spreadsheetId': 'SID', 'replies': [{}] * 1201}
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
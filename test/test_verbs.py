@@ -4,21 +4,15 @@ The verbs module dispatches on TargetType and delegates to a SheetsClient.
 We mock the client and assert the right methods are called with the right args.
 """
 
-import os
-import sys
-from unittest.mock import MagicMock
-
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from sheet_cli.grammar import GrammarError, Target
 from sheet_cli.verbs import do_del, do_get, do_new, do_put
 
 
 @pytest.fixture
-def client():
-    c = MagicMock()
+def client(mock_client):
+    c = mock_client
     # Default meta_read response: one sheet "Sheet1" with sheetId 0
     c.meta_read.return_value = {
         "sheets": [
@@ -102,6 +96,31 @@ class TestDoPut:
         ops = client.write.call_args.args[1]
         assert ops == [{"range": "Sheet1!A1:B2", "values": [[1, 2], [3, 4]]}]
 
+    def test_contiguous_cells_coalesce_into_block(self, client):
+        data = {"A1": 1, "B1": 2, "A2": 3, "B2": 4, "A3": 5}
+        do_put(client, Target("SID", "Sheet1", None), data)
+        ops = client.write.call_args.args[1]
+        assert ops == [
+            {"range": "Sheet1!A1:B2", "values": [[1, 2], [3, 4]]},
+            {"range": "Sheet1!A3", "values": [[5]]},
+        ]
+
+    def test_coalescing_keeps_sheets_and_gaps_apart(self, client):
+        data = {"A1": "a", "C1": "c", "Other!A1": "x", "Other!A2": "y"}
+        do_put(client, Target("SID", "Sheet1", None), data)
+        ops = client.write.call_args.args[1]
+        assert ops == [
+            {"range": "Sheet1!A1", "values": [["a"]]},
+            {"range": "Sheet1!C1", "values": [["c"]]},
+            {"range": "Other!A1:A2", "values": [["x"], ["y"]]},
+        ]
+
+    def test_mixed_keys_not_coalesced(self, client):
+        data = {"A1:B1": [[1, 2]], "C1": 3}
+        do_put(client, Target("SID", "Sheet1", None), data)
+        ops = client.write.call_args.args[1]
+        assert [op["range"] for op in ops] == ["Sheet1!A1:B1", "Sheet1!C1"]
+
     def test_drive_target_rejected(self, client):
         with pytest.raises(GrammarError):
             do_put(client, Target(None, None, None), {"A1": 1})